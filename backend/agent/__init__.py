@@ -4,6 +4,7 @@ Coordinates planning, execution, and validation.
 """
 from typing import Dict, Any, Optional
 from pathlib import Path
+import asyncio
 from .planner import TaskPlanner
 from .executor import TaskExecutor
 from .validator import Validator
@@ -27,16 +28,36 @@ class NewlaOrchestrator:
         self.workspace_root.mkdir(parents=True,exist_ok=True)
         self.planner = TaskPlanner(llm_provider=llm_provider)
         self.executor = TaskExecutor(self.workspace_root)
-        self.validator = Validator(self.workspace_root,llm_provider=llm_provider)
+        self.validator = Validator(
+            self.workspace_root,
+            llm_provider=llm_provider,
+            fs_tool=self.executor.fs_tool
+        )
         self.execution_history = []
     
     def run(self,user_prompt:str)->Dict[str,Any]:
         """
         Main execution flow.
-        
+
         Args:
             user_prompt: User's project request
-            
+
+        Returns:
+            Execution result
+        """
+        return asyncio.run(self.run_async(user_prompt))
+
+    async def run_async(self,user_prompt:str)->Dict[str,Any]:
+        """
+        Main execution flow, overlapping execution with LLM plan review.
+
+        Filesystem scaffolding starts as soon as the plan is parsed while
+        the LLM-based code review of the planned files runs concurrently,
+        hiding one LLM round-trip behind disk I/O.
+
+        Args:
+            user_prompt: User's project request
+
         Returns:
             Execution result
         """
@@ -47,13 +68,23 @@ class NewlaOrchestrator:
         }
         try:
             result["steps"].append({"step":"planning","status":"started"})
-            plan = self.planner.create_plan(user_prompt)
+            plan = await asyncio.to_thread(self.planner.create_plan,user_prompt)
             result["plan"] = plan
             result["steps"][-1]["status"]="completed"
 
             result["steps"].append({"step":"execution","status":"started"})
-            execution_result = self.executor.execute_plan(plan,max_retries=MAX_RETRIES)
+            planned_files = {
+                task["details"]["path"]: task["details"].get("content","")
+                for task in plan.get("tasks",[])
+                if task.get("type") in ("file_create","file_edit")
+                and task.get("details",{}).get("path")
+            }
+            execution_result,llm_review = await asyncio.gather(
+                self.executor.execute_plan_async(plan,max_retries=MAX_RETRIES),
+                asyncio.to_thread(self.validator.validate_with_llm,planned_files)
+            )
             result["execution"] = execution_result
+            result["llm_review"] = llm_review
             if execution_result.get("failed_tasks"):
                 result["steps"][-1]["status"] = "completed_with_errors"
                 
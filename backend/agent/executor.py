@@ -6,8 +6,15 @@ from typing import Dict, List, Any
 from pathlib import Path
 from ..tools.filesystem import FileSystemTool
 from ..tools.shell import ShellTool
+from .retry import retry_with_backoff
+import asyncio
+import os
 import time
 
+# Task types that only touch the filesystem and can run concurrently
+# when they target distinct paths.
+PARALLEL_TASK_TYPES = ("file_create", "file_edit", "directory_create")
+
 class TaskExecutor:
     """Executes tasks from execution plan."""
     def __init__(self,workspace_root:Path):
@@ -17,9 +24,50 @@ class TaskExecutor:
            workspace_root : Root workspace directory
         """
         self.workspace_root = workspace_root
+        self._ws_prefix = os.fspath(workspace_root) + os.sep
         self.fs_tool = FileSystemTool(workspace_root)
         self.shell_tool = ShellTool(workspace_root)
         self.execution_log = []
+        self._files_cache = None
+        self._files_cache_gen = 0
+        # O(1) task dispatch with handlers bound once at construction time
+        self._dispatch = {
+            "file_create": lambda d: self.fs_tool.write_file(
+                d.get("path"),d.get("content","")
+            ),
+            "file_edit": lambda d: self.fs_tool.write_file(
+                d.get("path"),d.get("content","")
+            ),
+            "directory_create": lambda d: self.fs_tool.create_directory(
+                d.get("path")
+            ),
+            "command": lambda d: self.shell_tool.execute(d.get("command")),
+            "install_dependencies": lambda d: self.shell_tool.install_dependencies(
+                d.get("package_manager","pip"),d.get("packages",[])
+            ),
+            "validation": self._handle_validation,
+        }
+
+    def _handle_validation(self,details:Dict[str,Any])->Dict[str,Any]:
+        """Handle a validation task."""
+        validation_type = details.get("validation_type")
+        if validation_type == "file_exists":
+            path = details.get("path")
+            exists = self.fs_tool.file_exists(path)
+            return{
+                "status":"success" if exists else "error",
+                "exists":exists
+            }
+        return{
+            "status":"success",
+            "message":"validation placeholder"
+        }
+
+    def _invalidate_files_cache(self):
+        """Drop the cached workspace listings after a filesystem change."""
+        self._files_cache_gen += 1
+        self._files_cache = None
+        self.fs_tool._invalidate_files_cache()
     def execute_task(self,task:Dict[str,Any])->Dict[str,Any]:
         """
         Execute a single task.
@@ -37,44 +85,15 @@ class TaskExecutor:
             "timestamp":time.time()
         }
         try:
-            if task_type == "file_create":
-                path = details.get("path")
-                content = details.get("content","")
-                fs_result = self.fs_tool.write_file(path,content)
-            elif task_type == "file_edit":
-                path = details.get("path")
-                content = details.get("content","")
-                fs_result = self.fs_tool.write_file(path,content)
-                result.update(fs_result)
-            elif task_type == "directory_create":
-                path = details.get("path")
-                fs_result = self.fs_tool.create_directory(path)
-                result.update(fs_result)
-            elif task_type == "command":
-                command = details.get("command")
-                shell_result = self.shell_tool.execute(command)
-                result.update(shell_result)
-            elif task_type == "install_dependencies":
-                package_manager = details.get("package_manager","pip")
-                packages = details.get("packages",[])
-                shell_result = self.shell_tool.install_dependencies(
-                    package_manager,packages
-                )
-                result.update(shell_result)
-            elif task_type == "validation":
-                validation_type = details.get("validation_type")
-                if validation_type == "file_exists":
-                    path = details.get("path")
-                    exists = self.fs_tool.file_exists(path)
-                    result["status"] = "success" if exists else "error"
-                    result["exists"] = exists
-                else:
-                    result["status"] = "success"
-                    result["message"] = "validation placeholder"
-            else:
+            handler = self._dispatch.get(task_type)
+            if handler is None:
                 result["status"] = "error"
                 result["error"] = f"Unknown task type : {task_type}"
+            else:
+                result.update(handler(details))
 
+            if task_type in ("file_create","file_edit","directory_create","command"):
+                self._invalidate_files_cache()
             self.execution_log.append(result)
             return result
         except Exception as e:
@@ -83,6 +102,85 @@ class TaskExecutor:
             self.execution_log.append(result)
             return result
         
+    async def execute_task_async(self,task:Dict[str,Any])->Dict[str,Any]:
+        """
+        Execute a single task without blocking the event loop.
+        Args:
+           task: Task dictionary from plan
+        Returns:
+           Execution result
+        """
+        return await asyncio.to_thread(self.execute_task,task)
+
+    def _partition_tasks(self,tasks:List[Dict[str,Any]])->List[List[Dict[str,Any]]]:
+        """
+        Partition tasks into levels that can run concurrently.
+
+        Pure filesystem tasks targeting distinct paths are grouped into one
+        level; commands and other task types act as barriers and run alone,
+        preserving plan order.
+        Args:
+           tasks: Ordered task list from plan
+        Returns:
+           List of task levels
+        """
+        levels = []
+        batch = []
+        batch_paths = set()
+        for task in tasks:
+            path = task.get("details",{}).get("path")
+            if task.get("type") in PARALLEL_TASK_TYPES and path not in batch_paths:
+                batch.append(task)
+                batch_paths.add(path)
+            else:
+                if batch:
+                    levels.append(batch)
+                    batch = []
+                    batch_paths = set()
+                levels.append([task])
+        if batch:
+            levels.append(batch)
+        return levels
+
+    async def _execute_with_retries(
+            self,
+            task:Dict[str,Any],
+            max_retries:int
+    )->Dict[str,Any]:
+        """Run a task with backoff retries, returning the last result."""
+        return await retry_with_backoff(
+            lambda: self.execute_task_async(task),
+            retries=max_retries
+        )
+
+    def _execute_file_batch(self,level:List[Dict[str,Any]])->List[Dict[str,Any]]:
+        """
+        Execute a level of file-write tasks as one bulk filesystem pass.
+        Args:
+           level: Tasks of type file_create/file_edit
+        Returns:
+           Per-task execution results
+        """
+        files = [
+            (task.get("details",{}).get("path"),
+             task.get("details",{}).get("content",""))
+            for task in level
+        ]
+        fs_results = self.fs_tool.write_files_bulk(files)
+        results = []
+        for task,fs_result in zip(level,fs_results):
+            result = {
+                "task_id":task.get("task_id"),
+                "description":task.get("description"),
+                "type":task.get("type"),
+                "timestamp":time.time()
+            }
+            result.update(fs_result)
+            self.execution_log.append(result)
+            results.append(result)
+        self._invalidate_files_cache()
+        return results
+
     def execute_plan(self,plan:Dict[str,Any],max_retries:int=3)->Dict[str,Any]:
         """
         Execute entire plan.
@@ -92,25 +190,39 @@ class TaskExecutor:
         Returns :
            Execution summary
         """
+        return asyncio.run(self.execute_plan_async(plan,max_retries=max_retries))
+
+    async def execute_plan_async(self,plan:Dict[str,Any],max_retries:int=3)->Dict[str,Any]:
+        """
+        Execute entire plan, running independent tasks concurrently.
+        Args:
+           plan : Execution plan from planner
+           max_retries : Maximum retries per task
+        Returns :
+           Execution summary
+        """
         tasks = plan.get("tasks",[])
         results = []
         failed_tasks = []
-        for task in tasks:
-            retry_count = 0
-            success = False
-            while retry_count <max_retries and not success:
-                result = self.execute_task(task)
-                if result.get("status")=="success":
-                    success = True
-                    results.append(result)
-                else:
-                    retry_count +=1
-                    if retry_count >= max_retries:
-                        failed_tasks.append({
-                            "task":task,
-                            "last_error":result.get("error")
-                        })
-                        results.append(result)
+        for level in self._partition_tasks(tasks):
+            if len(level) > 1 and all(
+                task.get("type") in ("file_create","file_edit") for task in level
+            ):
+                # Batch same-level file writes to amortize directory creation
+                level_results = await asyncio.to_thread(
+                    self._execute_file_batch,level
+                )
+            else:
+                level_results = await asyncio.gather(
+                    *[self._execute_with_retries(task,max_retries) for task in level]
+                )
+            for task,result in zip(level,level_results):
+                results.append(result)
+                if result.get("status")!="success":
+                    failed_tasks.append({
+                        "task":task,
+                        "last_error":result.get("error")
+                    })
         return{
              "plan_analysis": plan.get("analysis"),
             "expected_outcome": plan.get("expected_outcome"),
@@ -122,12 +234,24 @@ class TaskExecutor:
         }
     
     def get_workspace_files(self) -> List[str]:
-        """Get list of all files in workspace."""
+        """Get list of all files in workspace (cached between FS changes)."""
+        if self._files_cache is not None:
+            return self._files_cache
+        prefix_len = len(self._ws_prefix)
+        stack = [self._ws_prefix[:-1]]
         files = []
-        for item in self.workspace_root.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(self.workspace_root)
-                files.append(str(rel_path))
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.path[prefix_len:])
+            except OSError:
+                continue
+        self._files_cache = files
         return files
     
     def read_file_content(self, path: str) -> str:
@@ -1,12 +1,130 @@
 """Task planner for Newla AI
 Generates execution plans from user requests.
 """
-import json 
+import functools
+import json
 from typing import Dict, List, Any
 from pathlib import Path
 # from ..llm.router import LLMRouter
 from backend.llm.router import LLMRouter
 from .prompts import NEWLA_SYSTEM_PROMPT, PLANNING_PROMPT
+
+try:
+    import orjson
+except ImportError:  # optional speedup - stdlib json still works
+    orjson = None
+
+def _dumps(obj:Any,indent:bool=False)->str:
+    """Serialize with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj,option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj,indent=2 if indent else None)
+
+def _loads(s:str)->Any:
+    """Deserialize with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+# Precomputed at import time so the hot planning/retry path does no
+# repeated format-string scanning or list allocation.
+_REQUIRED_KEYS = frozenset(("analysis","tasks","expected_outcome"))
+_PLAN_PREFIX, _PLAN_SUFFIX = PLANNING_PROMPT.split("{user_request}")
+
+def _planning_prompt(user_request:str)->str:
+    """Build the planning prompt by concatenating precomputed parts."""
+    return _PLAN_PREFIX + user_request + _PLAN_SUFFIX
+
+def iter_plan_tasks(chunks)->Any:
+    """
+    Incrementally extract task objects from a streaming plan response.
+
+    Scans the accumulating buffer for the "tasks" array and yields each
+    task dictionary as soon as its JSON object is complete, without
+    waiting for the full response.
+    Args:
+       chunks: Iterable of response text chunks
+    Yields:
+       Parsed task dictionaries
+    """
+    buffer = ""
+    pos = 0
+    in_tasks = False
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        buffer += chunk
+        if not in_tasks:
+            key_idx = buffer.find('"tasks"')
+            if key_idx == -1:
+                continue
+            open_idx = buffer.find("[", key_idx)
+            if open_idx == -1:
+                continue
+            in_tasks = True
+            pos = open_idx + 1
+        while pos < len(buffer):
+            ch = buffer[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                if depth == 0:
+                    start = pos
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0 and start != -1:
+                    try:
+                        yield _loads(buffer[start:pos + 1])
+                    except json.JSONDecodeError:
+                        pass
+                    start = -1
+            elif ch == "]" and depth == 0:
+                return
+            pos += 1
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(llm_response:str)->Dict[str,Any]:
+    """
+    Parse an LLM response into a plan, memoized on the raw text.
+    Args:
+       llm_response:Raw LLM response
+    Returns:
+       Parsed plan dictionary
+    """
+    try:
+        # Try to extract JSON from response
+        response = llm_response.strip()
+        if response.startswith("```"):
+            response = response.removeprefix("```json").removeprefix("```")
+            response = response.removesuffix("```").strip()
+        plan = _loads(response)
+        if not _REQUIRED_KEYS <= plan.keys():
+            raise ValueError("Plan missing required keys")
+        return plan
+    except json.JSONDecodeError:
+        return{
+            "analysis":"Failed to parse structured plan",
+            "tasks":[
+                {
+                    "task_id":1,
+                    "description":"Manual execution required",
+                    "type":"manual",
+                    "details":{"raw_response":llm_response}
+                }
+            ],
+            "expected_outcome":"Manual review needed"
+        }
+
 class TaskPlanner:
     """Plans tasks based on user requests."""
     def __init__(self,llm_provider:str="claude"):
@@ -22,32 +140,9 @@ class TaskPlanner:
         Args:
            llm_response:Raw LLM response
         Returns:
-           Parsed plan dictionary
+           Parsed plan dictionary (copy of the memoized parse)
         """
-        try:
-            # Try to extract JSON from response
-            response = llm_response.strip()
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1])
-            plan = json.loads(response)
-            required_keys = ["analysis","tasks","expected_outcome"]
-            if not all(key in plan for key in required_keys):
-                raise ValueError("Plan missing required keys")
-            return plan
-        except json.JSONDecodeError as e:
-            return{
-                "analysis":"Failed to parse structured plan",
-                "tasks":[
-                    {
-                        "task_id":1,
-                        "description":"Manual execution required",
-                        "type":"manual",
-                        "details":{"raw_response":llm_response}
-                    }
-                ],
-                "expected_outcome":"Manual review needed"
-            }
+        return dict(_parse_cached(llm_response))
     def create_plan(self,user_request:str)->Dict[str,Any]:
         """
         Create execution plan form user request.
@@ -56,7 +151,7 @@ class TaskPlanner:
         Returns:
            Structured execution plan
         """
-        user_prompt = PLANNING_PROMPT.format(user_request=user_request)
+        user_prompt = _planning_prompt(user_request)
         llm_response = self.llm.call(
             system_prompt=NEWLA_SYSTEM_PROMPT,
             user_prompt=user_prompt
@@ -65,6 +160,29 @@ class TaskPlanner:
         plan["raw_llm_response"] = llm_response
         return plan
     
+    def stream_tasks(self,user_request:str)->Any:
+        """
+        Stream plan tasks as the LLM generates them.
+
+        Yields each task as soon as its JSON object is complete in the
+        response stream, so execution can overlap with generation. Falls
+        back to a blocking call when the provider has no streaming support.
+        Args:
+           user_request:User's project request
+        Yields:
+           Task dictionaries
+        """
+        user_prompt = _planning_prompt(user_request)
+        client = self.llm.get_client(self.llm.default_provider)
+        if hasattr(client,"stream"):
+            chunks = client.stream(NEWLA_SYSTEM_PROMPT,user_prompt)
+        else:
+            chunks = iter([self.llm.call(
+                system_prompt=NEWLA_SYSTEM_PROMPT,
+                user_prompt=user_prompt
+            )])
+        yield from iter_plan_tasks(chunks)
+
     def refine_plan(self,original_plan:Dict[str,Any],feedback:str)->Dict[str,Any]:
         """
         Refine an existing plan based on feedback.
@@ -74,9 +192,12 @@ class TaskPlanner:
         Returns:
             Refined execution plan
         """
+        # Serialized at refine time so the prompt reflects any mutations
+        # made to the plan since it was created
+        serialized = _dumps(original_plan, indent=True)
         user_prompt = f"""
 Original plan:
-{json.dumps(original_plan, indent=2)}
+{serialized}
 
 Feedback/Issues:
 {feedback}
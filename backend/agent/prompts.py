@@ -51,14 +51,10 @@ Return your response as a JSON object with this structure:
 """
 
 # Prompt for error fixing
+# Static instructions come first so prompt-caching can reuse the prefix;
+# the dynamic error/task details are interpolated at the end.
 ERROR_FIX_PROMPT = """An error occurred while executing the previous task.
 
-ERROR DETAILS:
-{error_details}
-
-TASK THAT FAILED:
-{failed_task}
-
 Your job is to:
 1. Analyze the error
 2. Identify the root cause
@@ -74,30 +70,36 @@ Return a JSON object with:
     "command": "corrected command (if applicable)"
   }
 }
+
+ERROR DETAILS:
+{error_details}
+
+TASK THAT FAILED:
+{failed_task}
 """
 
 # Prompt for code validation
+# Static instructions first, dynamic file contents last (cache-friendly).
 VALIDATION_PROMPT = """Review the generated code and ensure it:
 1. Runs without errors
 2. Meets the requirements
 3. Follows best practices
 4. Has no security vulnerabilities
 
-FILES TO VALIDATE:
-{files}
-
 Return a JSON object with:
 {
   "valid": true/false,
   "issues": ["list of issues if any"],
   "suggestions": ["list of improvements"]
 }
+
+FILES TO VALIDATE:
+{files}
 """
 
 # Prompt for project planning
-PLANNING_PROMPT = """Create a detailed plan for the following request:
-
-REQUEST: {user_request}
+# Static instructions first, dynamic request last (cache-friendly).
+PLANNING_PROMPT = """Create a detailed plan for the following request.
 
 Generate a step-by-step plan that includes:
 1. Project structure (folders and files)
@@ -107,4 +109,6 @@ Generate a step-by-step plan that includes:
 5. How to verify it works
 
 Return as JSON with the structure defined in the main system prompt.
+
+REQUEST: {user_request}
 """
\ No newline at end of file
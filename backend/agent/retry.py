@@ -0,0 +1,82 @@
+"""
+Retry policy for Newla AI task execution.
+Exponential backoff with jitter, and error classification so
+deterministic failures are not retried.
+"""
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Errors that will fail the same way on every attempt - retrying them
+# only wastes wall time.
+NON_RETRYABLE_PATTERNS = (
+    "Unknown task type",
+    "SyntaxError",
+    "PermissionError",
+    "Permission denied",
+    "Unsafe command detected",
+    "not in the allowed list",
+    "not allowed",
+    "Path traversal",
+    "escapes workspace",
+)
+
+
+def backoff_delay(attempt: int, base: float = 0.2, cap: float = 5.0) -> float:
+    """
+    Compute backoff delay for a retry attempt.
+
+    Args:
+        attempt: Zero-based attempt number
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds with jitter applied
+    """
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+
+def is_retryable(error: Optional[str]) -> bool:
+    """
+    Check whether an error message looks transient.
+
+    Args:
+        error: Error message from a task result
+
+    Returns:
+        False if the error matches a known deterministic failure
+    """
+    if not error:
+        return True
+    return not any(pattern in error for pattern in NON_RETRYABLE_PATTERNS)
+
+
+async def retry_with_backoff(
+    fn: Callable[[], Awaitable[Dict[str, Any]]],
+    retries: int = 3,
+    base: float = 0.2,
+    cap: float = 5.0
+) -> Dict[str, Any]:
+    """
+    Run an async task callable with exponential-backoff retries.
+
+    Args:
+        fn: Async callable returning a task result dictionary
+        retries: Maximum number of attempts
+        base: Base backoff delay in seconds
+        cap: Maximum backoff delay in seconds
+
+    Returns:
+        Last task result (successful or not)
+    """
+    result = {}
+    for attempt in range(retries):
+        result = await fn()
+        if result.get("status") == "success":
+            return result
+        if not is_retryable(result.get("error")):
+            return result
+        if attempt < retries - 1:
+            await asyncio.sleep(backoff_delay(attempt, base=base, cap=cap))
+    return result
@@ -3,30 +3,75 @@ Validator for Newla AI.
 Validates generated projects and detects errors.
 """
 
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
 from pathlib import Path
+import asyncio
 from ..tools.filesystem import FileSystemTool
 from ..tools.shell import ShellTool
 from ..llm.router import LLMRouter
 from .prompts import VALIDATION_PROMPT, ERROR_FIX_PROMPT
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # optional speedup - stdlib json still works
+    orjson = None
+
+def _dumps(obj:Any,indent:bool=False)->str:
+    """Serialize with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj,option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj,indent=2 if indent else None)
+
+def _loads(s:str)->Any:
+    """Deserialize with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+# Prompt templates split once at import time; building prompts by
+# concatenation avoids str.format scanning (and its clash with the
+# literal JSON braces in these templates) on every call.
+_VALIDATION_PREFIX, _VALIDATION_SUFFIX = VALIDATION_PROMPT.split("{files}")
+_FIX_PREFIX, _fix_rest = ERROR_FIX_PROMPT.split("{error_details}")
+_FIX_MIDDLE, _FIX_SUFFIX = _fix_rest.split("{failed_task}")
+
+# Deterministic local errors the LLM cannot usefully fix - matching these
+# skips the error-analysis round-trip entirely.
+LOCAL_ERROR_PATTERNS = [
+    (re.compile(r"Unknown task type"), "manual"),
+    (re.compile(r"SyntaxError"), "manual"),
+    (re.compile(r"Permission(Error| denied)"), "manual"),
+    (re.compile(r"not in the allowed list"), "manual"),
+    (re.compile(r"Unsafe command detected"), "manual"),
+    (re.compile(r"Path traversal|escapes workspace|not allowed"), "manual"),
+]
 
 
 class Validator:
     """Validates project correctness."""
     
-    def __init__(self, workspace_root: Path, llm_provider: str = "claude"):
+    def __init__(
+        self,
+        workspace_root: Path,
+        llm_provider: str = "claude",
+        fs_tool: FileSystemTool = None
+    ):
         """
         Initialize validator.
         
         Args:
             workspace_root: Workspace directory
             llm_provider: LLM provider for validation
+            fs_tool: Optional shared filesystem tool (reuses its listing cache)
         """
         self.workspace_root = workspace_root
-        self.fs_tool = FileSystemTool(workspace_root)
+        self.fs_tool = fs_tool or FileSystemTool(workspace_root)
         self.shell_tool = ShellTool(workspace_root)
         self.llm = LLMRouter(default_provider=llm_provider)
+        self._pool = ThreadPoolExecutor(max_workers=4)
     
     def validate_file_structure(self, expected_files: List[str]) -> Dict[str, Any]:
         """
@@ -38,15 +83,13 @@ class Validator:
         Returns:
             Validation result
         """
-        missing_files = []
-        existing_files = []
-        
-        for file_path in expected_files:
-            if self.fs_tool.file_exists(file_path):
-                existing_files.append(file_path)
-            else:
-                missing_files.append(file_path)
-        
+        # One cached workspace scan + set difference instead of a stat
+        # syscall per expected file
+        have = set(self.fs_tool.list_files_cached())
+        want = set(expected_files)
+        missing_files = sorted(want - have)
+        existing_files = sorted(want & have)
+
         return {
             "valid": len(missing_files) == 0,
             "existing_files": existing_files,
@@ -65,14 +108,21 @@ class Validator:
             Validation result
         """
         result = {"valid": True, "errors": []}
-        
+
         if language == "python":
-            # Check Python syntax
-            cmd_result = self.shell_tool.execute(f"python -m py_compile {file_path}")
-            if cmd_result.get("returncode") != 0:
+            # Check Python syntax in-process - same AST parse as py_compile
+            # without paying a subprocess spawn per file
+            try:
+                with open(self.workspace_root / file_path, "rb") as f:
+                    source = f.read()
+                compile(source, file_path, "exec")
+            except SyntaxError as e:
                 result["valid"] = False
-                result["errors"].append(cmd_result.get("stderr", ""))
-                
+                result["errors"].append(f"{e.msg} at line {e.lineno}")
+            except OSError as e:
+                result["valid"] = False
+                result["errors"].append(str(e))
+
         elif language == "javascript":
             # Check JavaScript syntax (if node is available)
             cmd_result = self.shell_tool.execute(f"node --check {file_path}")
@@ -82,6 +132,18 @@ class Validator:
         
         return result
     
+    def validate_syntax_many(self, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Validate syntax of several files in parallel.
+        
+        Args:
+            files: List of (file_path, language) tuples
+            
+        Returns:
+            Validation results in input order
+        """
+        return list(self._pool.map(lambda f: self.validate_syntax(*f), files))
+    
     def run_tests(self, test_command: str) -> Dict[str, Any]:
         """
         Run project tests.
@@ -100,6 +162,18 @@ class Validator:
             "errors": result.get("stderr", "")
         }
     
+    async def run_tests_async(self, test_command: str) -> Dict[str, Any]:
+        """
+        Run project tests without blocking the event loop.
+        
+        Args:
+            test_command: Command to run tests
+            
+        Returns:
+            Test results
+        """
+        return await asyncio.to_thread(self.run_tests, test_command)
+    
     def validate_with_llm(self, files_content: Dict[str, str]) -> Dict[str, Any]:
         """
         Use LLM to validate code quality.
@@ -110,8 +184,8 @@ class Validator:
         Returns:
             LLM validation result
         """
-        files_str = json.dumps(files_content, indent=2)
-        user_prompt = VALIDATION_PROMPT.format(files=files_str)
+        files_str = _dumps(files_content, indent=True)
+        user_prompt = _VALIDATION_PREFIX + files_str + _VALIDATION_SUFFIX
         
         try:
             llm_response = self.llm.call(
@@ -125,7 +199,7 @@ class Validator:
                 lines = response.split("\n")
                 response = "\n".join(lines[1:-1])
             
-            return json.loads(response)
+            return _loads(response)
             
         except Exception as e:
             return {
@@ -146,9 +220,19 @@ class Validator:
         Returns:
             Fix suggestion
         """
-        user_prompt = ERROR_FIX_PROMPT.format(
-            error_details=error_details,
-            failed_task=json.dumps(failed_task, indent=2)
+        # Short-circuit deterministic local errors without an LLM call
+        for pattern, fix_type in LOCAL_ERROR_PATTERNS:
+            if error_details and pattern.search(error_details):
+                return {
+                    "analysis": f"Deterministic local error: {error_details}",
+                    "fix_type": fix_type,
+                    "fix_details": {}
+                }
+
+        user_prompt = (
+            _FIX_PREFIX + error_details +
+            _FIX_MIDDLE + _dumps(failed_task, indent=True) +
+            _FIX_SUFFIX
         )
         
         try:
@@ -163,7 +247,7 @@ class Validator:
                 lines = response.split("\n")
                 response = "\n".join(lines[1:-1])
             
-            return json.loads(response)
+            return _loads(response)
             
         except Exception as e:
             return {
@@ -18,3 +18,5 @@ GEMINI_MODEL="gemini-1.5-flash"
 
 MAX_RETRIES=3
 COMMAND_TIMEOUT=30
+
+SEMANTIC_CACHE_THRESHOLD=0.92
@@ -0,0 +1,115 @@
+"""
+LLM response cache for Newla AI.
+Two-tier cache: in-memory LRU plus JSON files on disk.
+"""
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from ..config import BASE_DIR
+
+CACHE_DIR = BASE_DIR / ".llm_cache"
+DEFAULT_TTL = 3600
+DEFAULT_MAX_ENTRIES = 256
+
+
+def cache_disabled() -> bool:
+    """Check if caching is disabled via environment variable."""
+    return os.getenv("NEWLA_LLM_NOCACHE") == "1"
+
+
+class LLMCache:
+    """Two-tier (memory + disk) cache for LLM responses."""
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Initialize LLM cache.
+
+        Args:
+            cache_dir: Directory for on-disk cache entries
+            max_entries: Maximum in-memory entries (LRU eviction)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self._memory: OrderedDict = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _disk_path(self, key: str) -> Path:
+        """Get on-disk path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key (hex digest)
+
+        Returns:
+            Cached response text or None on miss/expiry
+        """
+        if cache_disabled():
+            return None
+
+        # Memory tier
+        entry = self._memory.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at > time.time():
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return value
+            del self._memory[key]
+
+        # Disk tier
+        disk_path = self._disk_path(key)
+        try:
+            entry = json.loads(disk_path.read_text(encoding="utf-8"))
+            if entry["expires_at"] > time.time():
+                self._remember(key, entry["value"], entry["expires_at"])
+                self.stats["hits"] += 1
+                return entry["value"]
+            disk_path.unlink()
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: str, ttl: int = DEFAULT_TTL) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            key: Cache key (hex digest)
+            value: Response text to cache
+            ttl: Time-to-live in seconds
+        """
+        if cache_disabled():
+            return
+
+        expires_at = time.time() + ttl
+        self._remember(key, value, expires_at)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_path(key).write_text(
+                json.dumps({"value": value, "expires_at": expires_at}),
+                encoding="utf-8"
+            )
+        except OSError:
+            pass
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        """Insert into the in-memory LRU tier, evicting oldest if full."""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
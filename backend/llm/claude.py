@@ -2,8 +2,39 @@
 Claude API integration for Newla AI.
 """
 import anthropic
+import concurrent.futures
+import hashlib
+import json
 import os
+import threading
 from typing import Optional, Dict, List
+from .cache import LLMCache
+
+# One anthropic.Anthropic per API key - each instance owns an HTTP
+# connection pool, so sharing it avoids a TCP+TLS handshake per client.
+_SHARED_CLIENTS: Dict[str, anthropic.Anthropic] = {}
+_SHARED_ASYNC_CLIENTS: Dict[str, anthropic.AsyncAnthropic] = {}
+# ClaudeClient instances reused by the call_claude convenience function.
+_DEFAULT_CLIENTS: Dict[str, "ClaudeClient"] = {}
+# Structured system blocks are immutable per prompt string; memoize them
+# so the handful of fixed planner/validator prompts aren't re-allocated
+# as list-of-dict payloads on every call.
+_SYSTEM_BLOCK_CACHE: Dict[str, List[Dict]] = {}
+
+def _system_blocks(system_prompt: str) -> List[Dict]:
+    """Return the cached structured system block for a prompt."""
+    blocks = _SYSTEM_BLOCK_CACHE.get(system_prompt)
+    if blocks is None:
+        blocks = [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
+        if len(_SYSTEM_BLOCK_CACHE) < 32:
+            _SYSTEM_BLOCK_CACHE[system_prompt] = blocks
+    return blocks
 class ClaudeClient:
     """Wrapper for Claude API calls."""
     def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307"):
@@ -16,8 +47,30 @@ class ClaudeClient:
         self.api_key = api_key or os.getenv("CLAUDE_API_KEY")
         if not self.api_key:
             raise ValueError("Claude API key not found. Set CLAUDE_API_KEY environment variable.")
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        if self.api_key not in _SHARED_CLIENTS:
+            _SHARED_CLIENTS[self.api_key] = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _SHARED_CLIENTS[self.api_key]
+        if self.api_key not in _SHARED_ASYNC_CLIENTS:
+            _SHARED_ASYNC_CLIENTS[self.api_key] = anthropic.AsyncAnthropic(api_key=self.api_key)
+        self.async_client = _SHARED_ASYNC_CLIENTS[self.api_key]
         self.model = model
+        self.cache = LLMCache()
+        # Coalesce concurrent identical requests: one in-flight API call
+        # per cache key, later callers block on its future.
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+    def _cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Build a deterministic cache key for a completion request."""
+        payload = json.dumps(
+            {
+                "model": self.model,
+                "system": system_prompt,
+                "user": user_prompt,
+                "max_tokens": max_tokens
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     def call(self, system_prompt: str, user_prompt: str, max_tokens: int = 4096) -> str:
         """
         Make a completion request to Claude.
@@ -29,18 +82,105 @@ class ClaudeClient:
         Returns:
             Claude's response text
         """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # If an identical request is already in flight, wait for its result
+        # instead of issuing a duplicate API call
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if inflight is not None:
+            return inflight.result()
+
         try:
             message = self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                system=system_prompt,
+                system=_system_blocks(system_prompt),
                 messages=[
                     {"role": "user", "content": user_prompt}
                 ]
             )
-            return message.content[0].text
+            text = message.content[0].text
+            self.cache.set(key, text)
+            future.set_result(text)
+            return text
+        except Exception as e:
+            error = RuntimeError(f"Claude API error: {str(e)}")
+            future.set_exception(error)
+            raise error
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    async def acall(self, system_prompt: str, user_prompt: str, max_tokens: int = 4096) -> str:
+        """
+        Make an async completion request to Claude.
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Claude's response text
+        """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            message = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=_system_blocks(system_prompt),
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
+            text = message.content[0].text
+            self.cache.set(key, text)
+            return text
+        except Exception as e:
+            raise RuntimeError(f"Claude API error: {str(e)}")
+    def stream(self, system_prompt: str, user_prompt: str, max_tokens: int = 4096):
+        """
+        Stream a completion from Claude, yielding text chunks as they arrive.
+
+        Lets callers start working on the response prefix (e.g. executing
+        early plan tasks) while the rest is still being generated.
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Response text chunks
+        """
+        key = self._cache_key(system_prompt, user_prompt, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        chunks = []
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=_system_blocks(system_prompt),
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
         except Exception as e:
             raise RuntimeError(f"Claude API error: {str(e)}")
+        self.cache.set(key, "".join(chunks))
     def call_with_history(
         self, 
         system_prompt: str, 
@@ -62,7 +202,7 @@ class ClaudeClient:
             message = self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
-                system=system_prompt,
+                system=_system_blocks(system_prompt),
                 messages=messages
             )
             return message.content[0].text
@@ -82,5 +222,6 @@ def call_claude(system_prompt: str, user_prompt: str, model: str = "claude-3-hai
     Returns:
         Response text
     """
-    client = ClaudeClient(model=model)
-    return client.call(system_prompt, user_prompt)
\ No newline at end of file
+    if model not in _DEFAULT_CLIENTS:
+        _DEFAULT_CLIENTS[model] = ClaudeClient(model=model)
+    return _DEFAULT_CLIENTS[model].call(system_prompt, user_prompt)
\ No newline at end of file
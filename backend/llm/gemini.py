@@ -3,9 +3,16 @@ Gemini API integration for Newla AI.
 """
 
 import google.generativeai as genai
+import hashlib
 import os
 from typing import Optional, List, Dict
 
+# GeminiClient instances reused by the call_gemini convenience function,
+# keyed by model name. Re-creating a client per call re-runs
+# genai.configure and GenerativeModel init (and the TLS setup underneath)
+# every time.
+_CLIENTS: Dict[str, "GeminiClient"] = {}
+
 
 class GeminiClient:
     """Wrapper for Gemini API calls."""
@@ -23,7 +30,39 @@ class GeminiClient:
             raise ValueError("Gemini API key not found. Set GEMINI_API_KEY environment variable.")
         
         genai.configure(api_key=self.api_key)
+        self.model_name = model
         self.model = genai.GenerativeModel(model)
+        # Prefix-cache registry: model handles keyed by a hash of the
+        # system prompt. Where the API supports it the prompt is
+        # registered server-side as CachedContent, so repeated calls skip
+        # prefill on the static prefix; otherwise a handle carrying the
+        # frozen system_instruction still keeps the prefix byte-identical
+        # across calls.
+        self._prefix_cache: Dict[str, genai.GenerativeModel] = {}
+
+    def _model_for_system(self, system_prompt: str) -> "genai.GenerativeModel":
+        """Get or create a model handle with a static system instruction."""
+        h = hashlib.blake2b(
+            system_prompt.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        handle = self._prefix_cache.get(h)
+        if handle is None:
+            try:
+                cached = genai.caching.CachedContent.create(
+                    model=self.model_name,
+                    system_instruction=system_prompt,
+                    ttl="3600s"
+                )
+                handle = genai.GenerativeModel.from_cached_content(cached)
+            except Exception:
+                # CachedContent needs a supported model/plan - fall back
+                # to a plain handle with the frozen system instruction
+                handle = genai.GenerativeModel(
+                    self.model_name, system_instruction=system_prompt
+                )
+            if len(self._prefix_cache) < 32:
+                self._prefix_cache[h] = handle
+        return handle
     
     def call(self, system_prompt: str, user_prompt: str) -> str:
         """
@@ -46,6 +85,47 @@ class GeminiClient:
         except Exception as e:
             raise RuntimeError(f"Gemini API error: {str(e)}")
     
+    async def acall(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Make an async completion request to Gemini.
+        
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+            
+        Returns:
+            Gemini's response text
+        """
+        try:
+            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+            response = await self.model.generate_content_async(full_prompt)
+            
+            return response.text
+            
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {str(e)}")
+    
+    def stream(self, system_prompt: str, user_prompt: str):
+        """
+        Stream a completion from Gemini, yielding text chunks as they arrive.
+
+        Args:
+            system_prompt: System instruction
+            user_prompt: User message
+
+        Yields:
+            Response text chunks
+        """
+        try:
+            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+            response = self.model.generate_content(full_prompt, stream=True)
+            for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            raise RuntimeError(f"Gemini API error: {str(e)}")
+
     def call_with_history(
         self, 
         system_prompt: str, 
@@ -62,19 +142,28 @@ class GeminiClient:
             Gemini's response text
         """
         try:
-            # Convert messages to Gemini format
-            chat = self.model.start_chat(history=[])
-            
-            # Add system prompt as first message
-            full_conversation = system_prompt + "\n\n"
-            
-            for msg in messages:
-                role = "user" if msg["role"] == "user" else "model"
-                full_conversation += f"{role}: {msg['content']}\n\n"
-            
-            response = self.model.generate_content(full_conversation)
+            # Native chat API: the system prompt rides on the cached model
+            # handle and history is passed as structured messages, so no
+            # conversation string is ever built in Python and the SDK can
+            # reuse its own chat state.
+            model = self._model_for_system(system_prompt)
+            if not messages:
+                # Empty history: nothing to send through the chat API -
+                # issue a bare completion on the system prompt, as the
+                # old string-building loop effectively did
+                response = self.model.generate_content(system_prompt)
+                return response.text
+            history = [
+                {
+                    "role": "user" if msg["role"] == "user" else "model",
+                    "parts": [msg["content"]]
+                }
+                for msg in messages[:-1]
+            ]
+            chat = model.start_chat(history=history)
+            response = chat.send_message(messages[-1]["content"])
             return response.text
-            
+
         except Exception as e:
             raise RuntimeError(f"Gemini API error: {str(e)}")
 
@@ -91,5 +180,6 @@ def call_gemini(system_prompt: str, user_prompt: str, model: str = "gemini-1.5-f
     Returns:
         Response text
     """
-    client = GeminiClient(model=model)
-    return client.call(system_prompt, user_prompt)
\ No newline at end of file
+    if model not in _CLIENTS:
+        _CLIENTS[model] = GeminiClient(model=model)
+    return _CLIENTS[model].call(system_prompt, user_prompt)
\ No newline at end of file
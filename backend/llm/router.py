@@ -2,9 +2,41 @@
 LLM Router for Newla AI
 Routes requests to Claude or Gemini based on configuration.
 """
+import asyncio
+import functools
+import hashlib
+import json
 from typing import Dict, List, Optional
 from .claude import call_claude, ClaudeClient
 from .gemini import call_gemini, GeminiClient
+from .cache import LLMCache
+from .semantic_cache import SemanticCache
+
+# One semantic cache for the whole process: SemanticCache.set rewrites
+# the index file from its in-memory entries, so independent instances
+# over the same file would drop each other's writes (and re-embed the
+# same prompt once per instance). The router is the only layer that
+# talks to it.
+_SEMANTIC_CACHE = SemanticCache()
+
+@functools.lru_cache(maxsize=8)
+def _get_client(provider:str,model:Optional[str]=None):
+    """Get the process-wide client for a (provider, model) pair.
+
+    Each orchestrator builds its own LLMRouter, so without this registry
+    a per-request provider override pays full SDK init on every request.
+    Args:
+       provider:"claude" or "gemini"
+       model: optional model override (provider default when None)
+    Returns:
+       Shared client instance
+    """
+    if provider == "claude":
+        return ClaudeClient(model=model) if model else ClaudeClient()
+    elif provider == "gemini":
+        return GeminiClient(model=model) if model else GeminiClient()
+    else:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
 class LLMRouter:
     """Routes LLM requests to appropriate provider."""
     def __init__(self,default_provider:str="claude"):
@@ -14,20 +46,22 @@ class LLMRouter:
            default_provider:Default LLM provider("claude"or"gemini")
         """
         self.default_provider = default_provider
-        self.claude_client = None
-        self.gemini_client = None
+        self.cache = LLMCache()
+        self.semantic_cache = _SEMANTIC_CACHE
+        self._batch_queue = None
+        self._batch_task = None
+    def _cache_key(self,provider:str,system_prompt:str,payload:str)->str:
+        """Build an exact-match cache key for a routed request."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(provider.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(system_prompt.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(payload.encode("utf-8"))
+        return digest.hexdigest()
     def get_client(self,provider:str):
-        """Get or create client for specified provider."""
-        if provider == "claude":
-            if not self.claude_client:
-                self.claude_client = ClaudeClient()
-            return self.claude_client
-        elif provider == "gemini":
-            if not self.gemini_client:
-                self.gemini_client = GeminiClient()
-            return self.gemini_client
-        else:
-            raise ValueError(f"Unsupported LLM provider: {provider}")
+        """Get the shared client for specified provider."""
+        return _get_client(provider)
     def call(self,system_prompt:str,user_prompt:str,provider:Optional[str]=None)->str:
         """Make an LLM completion request.
         Args:
@@ -38,8 +72,128 @@ class LLMRouter:
            LLM response text
         """
         provider = provider or self.default_provider
+        key = self._cache_key(provider,system_prompt,user_prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        prompt_text = f"{system_prompt}\n\n{user_prompt}"
+        cached = self.semantic_cache.get(prompt_text,provider)
+        if cached is not None:
+            return cached
         client = self.get_client(provider)
-        return client.call(system_prompt,user_prompt)
+        response = client.call(system_prompt,user_prompt)
+        self.cache.set(key,response)
+        self.semantic_cache.set(prompt_text,response,provider)
+        return response
+    async def acall(self,system_prompt:str,user_prompt:str,provider:Optional[str]=None)->str:
+        """Make an async LLM completion request.
+        Args:
+           system_prompt: System instruction
+           user_prompt : User message
+           provider: LLM provider to use (defaults to default_provider)
+        Returns:
+           LLM response text
+        """
+        provider = provider or self.default_provider
+        key = self._cache_key(provider,system_prompt,user_prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        client = self.get_client(provider)
+        if hasattr(client,"acall"):
+            response = await client.acall(system_prompt,user_prompt)
+        else:
+            response = await asyncio.to_thread(
+                client.call,system_prompt,user_prompt
+            )
+        self.cache.set(key,response)
+        return response
+    def stream_call(self,system_prompt:str,user_prompt:str,provider:Optional[str]=None):
+        """Stream an LLM completion, yielding text chunks as they arrive.
+        Args:
+           system_prompt: System instruction
+           user_prompt : User message
+           provider: LLM provider to use (defaults to default_provider)
+        Yields:
+           Response text chunks
+        """
+        provider = provider or self.default_provider
+        key = self._cache_key(provider,system_prompt,user_prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        client = self.get_client(provider)
+        chunks = []
+        for chunk in client.stream(system_prompt,user_prompt):
+            chunks.append(chunk)
+            yield chunk
+        self.cache.set(key,"".join(chunks))
+    # Micro-batching: requests arriving within this window (or until the
+    # batch fills) are dispatched together in one concurrent burst.
+    BATCH_WINDOW = 0.02
+    BATCH_MAX_SIZE = 16
+    async def abatch_call(self,system_prompt:str,user_prompt:str,provider:Optional[str]=None)->str:
+        """Queue a request for micro-batched dispatch.
+
+        Calls arriving within BATCH_WINDOW seconds (up to BATCH_MAX_SIZE)
+        are collected by a background dispatcher and issued concurrently,
+        amortizing per-call scheduling overhead under concurrent load.
+        Args:
+           system_prompt: System instruction
+           user_prompt : User message
+           provider: LLM provider to use (defaults to default_provider)
+        Returns:
+           LLM response text
+        """
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_dispatcher())
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((system_prompt,user_prompt,provider,future))
+        return await future
+    async def _batch_dispatcher(self):
+        """Background task draining the batch queue and resolving futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_MAX_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._batch_queue.get(),timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            responses = await asyncio.gather(
+                *[self.acall(s,u,p) for s,u,p,_ in batch],
+                return_exceptions=True
+            )
+            for (_,_,_,future),response in zip(batch,responses):
+                if future.cancelled():
+                    continue
+                if isinstance(response,Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+    async def acall_with_history(self,system_prompt:str,
+                                 messages:List[Dict[str,str]],
+                                 provider:Optional[str]=None)->str:
+        """Make an async LLM completion request with conversation history.
+        Args:
+           system_prompt: System instruction
+           messages : conversation history
+           provider: llm provider to use
+        Returns:
+           LLM response text
+        """
+        provider = provider or self.default_provider
+        return await asyncio.to_thread(
+            self.call_with_history,system_prompt,messages,provider
+        )
     def call_with_history(self,system_prompt:str,
                           messages:List[Dict[str,str]],
                           provider:Optional[str]=None)->str:
@@ -52,8 +206,16 @@ class LLMRouter:
            LLM response text
            """
         provider = provider or self.default_provider
+        key = self._cache_key(
+            provider,system_prompt,json.dumps(messages,sort_keys=True)
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         client = self.get_client(provider)
-        return client.call_with_history(system_prompt,messages)
+        response = client.call_with_history(system_prompt,messages)
+        self.cache.set(key,response)
+        return response
     
 def call_llm(provider:str,system_prompt:str,user_prompt:str)->str:
         """Convenience function to call any LLM provider.
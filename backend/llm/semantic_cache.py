@@ -0,0 +1,127 @@
+"""
+Semantic cache for near-duplicate LLM prompts.
+Sits above the exact-hash cache: prompts that are phrased differently but
+mean the same thing ("make a flask app" vs "create a flask project") hit
+the same cached response when their embeddings are close enough.
+
+Requires the optional sentence-transformers package; the cache silently
+disables itself when it is not installed.
+"""
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from .cache import CACHE_DIR, cache_disabled
+from ..config import SEMANTIC_CACHE_THRESHOLD
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+INDEX_PATH = CACHE_DIR / "semantic_index.json"
+
+
+class SemanticCache:
+    """Embedding-based nearest-neighbor cache for LLM responses."""
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        index_path: Path = INDEX_PATH
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            index_path: JSON file persisting embeddings and responses
+        """
+        self.threshold = threshold
+        self.index_path = Path(index_path)
+        self._model = None
+        self._entries: List[dict] = []
+        self._loaded = False
+
+    def available(self) -> bool:
+        """Check whether the embedding model dependency is installed."""
+        return SentenceTransformer is not None and not cache_disabled()
+
+    def _load(self) -> None:
+        """Load persisted entries from disk (once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            self._entries = json.loads(
+                self.index_path.read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            self._entries = []
+
+    def _embed(self, text: str) -> List[float]:
+        """Compute a normalized embedding for a prompt."""
+        if self._model is None:
+            self._model = SentenceTransformer(MODEL_NAME)
+        return self._model.encode(text, normalize_embeddings=True).tolist()
+
+    def get(self, prompt: str, provider: Optional[str] = None) -> Optional[str]:
+        """
+        Look up the nearest cached prompt.
+
+        Args:
+            prompt: Combined system + user prompt text
+            provider: LLM provider the response must come from; entries
+                from other providers are skipped (entries persisted
+                without a provider match any)
+
+        Returns:
+            Cached response if the best match clears the similarity
+            threshold, otherwise None
+        """
+        if not self.available():
+            return None
+        self._load()
+        if not self._entries:
+            return None
+
+        embedding = self._embed(prompt)
+        best_score = -1.0
+        best_response = None
+        for entry in self._entries:
+            if provider is not None and entry.get("provider") not in (None, provider):
+                continue
+            score = sum(a * b for a, b in zip(embedding, entry["embedding"]))
+            if score > best_score:
+                best_score = score
+                best_response = entry["response"]
+
+        if best_score >= self.threshold:
+            return best_response
+        return None
+
+    def set(self, prompt: str, response: str, provider: Optional[str] = None) -> None:
+        """
+        Store a prompt/response pair and persist the index.
+
+        Args:
+            prompt: Combined system + user prompt text
+            response: LLM response to cache
+            provider: LLM provider that produced the response
+        """
+        if not self.available():
+            return
+        self._load()
+        self._entries.append({
+            "embedding": self._embed(prompt),
+            "response": response,
+            "provider": provider
+        })
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self.index_path.write_text(
+                json.dumps(self._entries), encoding="utf-8"
+            )
+        except OSError:
+            pass
@@ -2,11 +2,28 @@
 Newla AI - FastAPI entry point
 local autonomous agent for software development
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, Response, StreamingResponse
+try:
+    from fastapi.responses import ORJSONResponse
+    _default_response_class = ORJSONResponse
+except ImportError:  # orjson not installed - stdlib JSON still works
+    from fastapi.responses import JSONResponse
+    _default_response_class = JSONResponse
+try:
+    import orjson
+    def _ndjson_line(obj)->bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    def _ndjson_line(obj)->bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
+import asyncio
+import hashlib
+import json
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,7 +36,10 @@ from config import WORKSPACE_ROOT, DEFAULT_LLM
 app = FastAPI(
     title="Newla AI",
     description="Local autonomous software engineer agent",
-    version="0.1.0"
+    version="0.1.0",
+    # orjson serializes straight to bytes; large file listings and
+    # histories skip the pure-Python json.dumps pass
+    default_response_class=_default_response_class
 )
 app.add_middleware(
     CORSMiddleware,
@@ -33,12 +53,88 @@ orchestrator = NewlaOrchestrator(
     workspace_root = WORKSPACE_ROOT,
     llm_provider = DEFAULT_LLM
 )
+# Orchestrators for per-request provider overrides, built once per
+# provider instead of per request (the underlying LLM clients are shared
+# process-wide by the router's registry)
+_orchestrators:Dict[str,NewlaOrchestrator] = {DEFAULT_LLM:orchestrator}
+
+def _orchestrator_for(provider:str)->NewlaOrchestrator:
+    """Get or create the orchestrator for an LLM provider."""
+    if provider not in _orchestrators:
+        _orchestrators[provider] = NewlaOrchestrator(
+            workspace_root = WORKSPACE_ROOT,
+            llm_provider = provider
+        )
+    return _orchestrators[provider]
+
+# Maximum LLM streams in flight at once; further requests wait in the
+# scheduler queue and start the instant a slot frees up.
+MAX_INFLIGHT = 16
+
+class RequestScheduler:
+    """Continuous-batching scheduler for streaming LLM requests.
+
+    Handlers enqueue (prompt, output queue) pairs and stream from their
+    own queue; a single background loop keeps up to MAX_INFLIGHT
+    provider streams running, admitting the next waiting prompt as soon
+    as one finishes instead of serializing requests.
+    """
+    def __init__(self):
+        self._queue = None
+        self._task = None
+        self._semaphore = None
+
+    async def submit(self,system_prompt:str,user_prompt:str,
+                     provider:Optional[str]=None)->asyncio.Queue:
+        """Enqueue a prompt and return its per-request output queue."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(MAX_INFLIGHT)
+            self._task = asyncio.create_task(self._loop())
+        out = asyncio.Queue()
+        await self._queue.put((system_prompt,user_prompt,provider,out))
+        return out
+
+    async def _loop(self):
+        """Admit queued requests whenever an inflight slot is free."""
+        while True:
+            item = await self._queue.get()
+            await self._semaphore.acquire()
+            asyncio.create_task(self._dispatch(*item))
+
+    async def _dispatch(self,system_prompt:str,user_prompt:str,
+                        provider:Optional[str],out:asyncio.Queue):
+        """Pump one provider stream into its request's output queue."""
+        loop = asyncio.get_running_loop()
+        router = orchestrator.planner.llm
+
+        def pump():
+            try:
+                for chunk in router.stream_call(
+                    system_prompt,user_prompt,provider
+                ):
+                    loop.call_soon_threadsafe(out.put_nowait,("data",chunk))
+                loop.call_soon_threadsafe(out.put_nowait,("done",None))
+            except Exception as e:
+                loop.call_soon_threadsafe(out.put_nowait,("error",str(e)))
+
+        try:
+            await asyncio.to_thread(pump)
+        finally:
+            self._semaphore.release()
+
+scheduler = RequestScheduler()
 
 class ProjectRequest(BaseModel):
     """Request model for project creation."""
     prompt: str
     llm_provider: Optional[str] = None
 
+class BatchRequest(BaseModel):
+    """Request model for batched project creation."""
+    prompts: List[str]
+    llm_provider: Optional[str] = None
+
 class StatusResponse(BaseModel):
     """Response model for status check."""
     status: str
@@ -73,26 +169,111 @@ async def run_agent(request:ProjectRequest)->Dict[str,Any]:
         if not request.prompt or not request.prompt.strip():
             raise HTTPException(status_code=400,detail="Prompt cannot be empty.")
         if request.llm_provider:
-            temp_orchestrator = NewlaOrchestrator(
-                workspace_root = WORKSPACE_ROOT,
-                llm_provider = request.llm_provider
-            )
-            result = temp_orchestrator.run(request.prompt)
+            temp_orchestrator = _orchestrator_for(request.llm_provider)
+            result = await asyncio.to_thread(temp_orchestrator.run,request.prompt)
         else:
-            result = orchestrator.run(request.prompt)
+            result = await asyncio.to_thread(orchestrator.run,request.prompt)
         return result
     except Exception as e:
         raise HTTPException(status_code=500,detail=str(e))
     
+@app.post("/run-batch")
+async def run_agent_batch(request:BatchRequest)->Dict[str,Any]:
+    """
+    Run several prompts in one request.
+
+    All prompts share one HTTP round-trip and one orchestrator, and are
+    executed concurrently; a failed prompt reports its error in place
+    without aborting the rest of the batch.
+
+    Args:
+        request: Batch request with list of prompts
+
+    Returns:
+        Per-prompt execution results
+    """
+    try:
+        if not request.prompts:
+            raise HTTPException(status_code=400,detail="Prompts cannot be empty.")
+        if request.llm_provider:
+            target = _orchestrator_for(request.llm_provider)
+        else:
+            target = orchestrator
+        results = await asyncio.gather(
+            *[asyncio.to_thread(target.run,prompt) for prompt in request.prompts],
+            return_exceptions=True
+        )
+        return{
+            "total":len(results),
+            "results":[
+                {"status":"error","error":str(r)} if isinstance(r,Exception) else r
+                for r in results
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=str(e))
+
+@app.post("/run/stream")
+async def run_agent_stream(request:ProjectRequest)->StreamingResponse:
+    """
+    Stream planning-LLM tokens for a request as server-sent events.
+
+    Tokens reach the client as soon as the provider emits them instead of
+    after the full generation completes, so time-to-first-token is no
+    longer bounded by total decode time. Requests go through the shared
+    RequestScheduler, which keeps up to MAX_INFLIGHT streams running
+    concurrently and admits waiting prompts the instant a slot frees up.
+
+    Args:
+        request: Project request with prompt
+
+    Returns:
+        SSE stream of response tokens
+    """
+    if not request.prompt or not request.prompt.strip():
+        raise HTTPException(status_code=400,detail="Prompt cannot be empty.")
+    from backend.agent.prompts import NEWLA_SYSTEM_PROMPT
+    out = await scheduler.submit(
+        NEWLA_SYSTEM_PROMPT,request.prompt,request.llm_provider
+    )
+
+    async def event_stream():
+        while True:
+            kind,payload = await out.get()
+            if kind == "data":
+                for line in payload.splitlines():
+                    yield f"data: {line}\n"
+                yield "\n"
+            elif kind == "error":
+                yield f"event: error\ndata: {payload}\n\n"
+                return
+            else:
+                yield "event: done\ndata: \n\n"
+                return
+
+    return StreamingResponse(event_stream(),media_type="text/event-stream")
+
 @app.get("/workspace")
-async def get_workspace_info()->Dict[str,Any]:
+async def get_workspace_info(request:Request):
     """
     Get information about current workspace.
+
+    The response carries an ETag over the summary; clients sending a
+    matching If-None-Match get an empty 304 instead of the full listing.
     Returns:
         Workspace information
     """
     try:
-        return orchestrator.get_project_summary()
+        summary = await asyncio.to_thread(orchestrator.get_project_summary)
+        etag = '"' + hashlib.blake2b(
+            json.dumps(summary,sort_keys=True,default=str).encode("utf-8"),
+            digest_size=16
+        ).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304,headers={"ETag":etag})
+        return _default_response_class(summary,headers={"ETag":etag})
     except Exception as e:
         raise HTTPException(status_code=500,detail=str(e))
     
@@ -104,7 +285,7 @@ async def list_workspace_files()->Dict[str,Any]:
       File listing
     """
     try:
-        files = orchestrator.executor.get_workspace_files()
+        files = await asyncio.to_thread(orchestrator.executor.get_workspace_files)
         return{
             "total":len(files),
             "files":files
@@ -112,6 +293,28 @@ async def list_workspace_files()->Dict[str,Any]:
     except Exception as e:
         raise HTTPException(status_code=500,detail=str(e))
 
+@app.get("/workspace/files_stream")
+async def stream_workspace_file_list()->StreamingResponse:
+    """
+    Stream the workspace file listing as NDJSON.
+
+    One record per line - a preamble with the total, then a
+    {"path": ...} object per file - so clients can start printing as
+    soon as the first line arrives instead of buffering the whole
+    listing.
+
+    Returns:
+        NDJSON stream of workspace files
+    """
+    files = await asyncio.to_thread(orchestrator.executor.get_workspace_files)
+
+    def ndjson():
+        yield _ndjson_line({"total":len(files)})
+        for path in files:
+            yield _ndjson_line({"path":path})
+
+    return StreamingResponse(ndjson(),media_type="application/x-ndjson")
+
 @app.post("/workspace/files/{file_path:path}")
 async def read_workspace_file(file_path:str)->Dict[str,Any]:
     """
@@ -124,7 +327,9 @@ async def read_workspace_file(file_path:str)->Dict[str,Any]:
         File content
     """
     try:
-        content = orchestrator.executor.read_file_content(file_path)
+        content = await asyncio.to_thread(
+            orchestrator.executor.read_file_content,file_path
+        )
         if content:
             return {
                 "path": file_path,
@@ -135,6 +340,30 @@ async def read_workspace_file(file_path:str)->Dict[str,Any]:
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
      
+@app.get("/workspace/files_raw/{file_path:path}")
+async def read_workspace_file_raw(file_path:str)->FileResponse:
+    """
+    Serve a workspace file's raw bytes directly.
+
+    FileResponse hands the file to the OS via sendfile, so large files
+    reach the client without being read into Python memory or wrapped in
+    a JSON envelope.
+
+    Args:
+        file_path: Path to file relative to workspace
+
+    Returns:
+        Raw file contents
+    """
+    from backend.tools.safety import validate_path
+    try:
+        full_path = validate_path(file_path,orchestrator.workspace_root)
+    except RuntimeError as e:
+        raise HTTPException(status_code=400,detail=str(e))
+    if not full_path.is_file():
+        raise HTTPException(status_code=404,detail="File not found")
+    return FileResponse(full_path)
+
 @app.get("/history")
 async def get_execution_history()->Dict[str,Any]:
     """
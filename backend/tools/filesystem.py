@@ -5,10 +5,15 @@ All operations are restricted to workspace/ directory.
 
 from pathlib import Path
 from typing import Optional, List, Dict
+import mmap
 import os
 import shutil
 from .safety import validate_path, validate_file_operation
 
+# Files at or above this size are read through mmap instead of read_text,
+# avoiding the intermediate bytes buffer before decoding.
+MMAP_READ_THRESHOLD = 1024 * 1024
+
 
 class FileSystemTool:
     """Handles all filesystem operations within workspace."""
@@ -22,7 +27,50 @@ class FileSystemTool:
         """
         self.workspace_root = workspace_root.resolve()
         self.workspace_root.mkdir(parents=True, exist_ok=True)
-    
+        # Root prefix as a plain string: relative paths on result dicts
+        # are produced by slicing instead of PurePath.relative_to, which
+        # walks and reallocates path parts per call
+        self._root_str = str(self.workspace_root) + os.sep
+        self._files_cache = None
+
+    def _rel(self, full_path: Path) -> str:
+        """Return a path relative to the workspace root by string slice."""
+        path_str = str(full_path)
+        if path_str.startswith(self._root_str):
+            return path_str[len(self._root_str):]
+        return path_str
+
+    def _invalidate_files_cache(self):
+        """Drop the cached workspace listing after a filesystem change."""
+        self._files_cache = None
+
+    def list_files_cached(self) -> List[str]:
+        """
+        List all files in the workspace, cached between modifications.
+
+        Returns:
+            List of file paths relative to the workspace root
+        """
+        if self._files_cache is not None:
+            return self._files_cache
+        root = str(self.workspace_root)
+        prefix_len = len(root) + 1
+        stack = [root]
+        files = []
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            files.append(entry.path[prefix_len:])
+            except OSError:
+                continue
+        self._files_cache = files
+        return files
+
     def write_file(self, path: str, content: str) -> Dict[str, str]:
         """
         Create or overwrite a file with content.
@@ -43,11 +91,13 @@ class FileSystemTool:
             
             # Write content
             full_path.write_text(content, encoding="utf-8")
-            
+
+            self._invalidate_files_cache()
+
             return {
                 "status": "success",
                 "action": "write_file",
-                "path": str(full_path.relative_to(self.workspace_root)),
+                "path": self._rel(full_path),
                 "size": len(content)
             }
         except Exception as e:
@@ -58,6 +108,124 @@ class FileSystemTool:
                 "error": str(e)
             }
     
+    def write_files_bulk(self, files: List[tuple]) -> List[Dict[str, str]]:
+        """
+        Write many files in one pass.
+
+        Parent directories are created once per unique directory instead of
+        per file, amortizing mkdir/directory-sync overhead on large scaffolds.
+
+        Args:
+            files: List of (path, content) tuples
+
+        Returns:
+            List of status dictionaries, one per file
+        """
+        results = []
+        created_dirs = set()
+        for path, content in files:
+            try:
+                full_path = validate_path(path, self.workspace_root)
+                validate_file_operation(path, "write")
+
+                parent = full_path.parent
+                if parent not in created_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(parent)
+
+                full_path.write_text(content, encoding="utf-8")
+
+                results.append({
+                    "status": "success",
+                    "action": "write_file",
+                    "path": self._rel(full_path),
+                    "size": len(content)
+                })
+            except Exception as e:
+                results.append({
+                    "status": "error",
+                    "action": "write_file",
+                    "path": path,
+                    "error": str(e)
+                })
+        self._invalidate_files_cache()
+        return results
+
+    def bulk_ops(self, ops: List[tuple]) -> List[Dict[str, str]]:
+        """
+        Execute a batch of filesystem operations in one pass.
+
+        One call crosses the tool boundary once for the whole batch; the
+        workspace-root resolution behind validate_path is cached, so each
+        op pays only its own syscall.
+
+        Args:
+            ops: List of (op, path, payload) tuples where op is "write",
+                 "read" or "mkdir"; payload is the content for writes
+
+        Returns:
+            List of status dictionaries, one per operation in order
+        """
+        results = []
+        for op, path, payload in ops:
+            if op == "write":
+                results.append(self.write_file(path, payload or ""))
+            elif op == "read":
+                results.append(self.read_file(path))
+            elif op == "mkdir":
+                results.append(self.create_directory(path))
+            else:
+                results.append({
+                    "status": "error",
+                    "action": op,
+                    "path": path,
+                    "error": f"Unknown operation: {op}"
+                })
+        return results
+
+    def write_file_stream(self, path: str, chunks) -> Dict[str, str]:
+        """
+        Write a file from an iterable of text chunks.
+
+        Chunks are written as they arrive through a large write buffer,
+        so streamed LLM output lands on disk without first being
+        materialized as one big string in memory.
+
+        Args:
+            path: Relative path within workspace
+            chunks: Iterable of content chunks
+
+        Returns:
+            Status dictionary
+        """
+        try:
+            full_path = validate_path(path, self.workspace_root)
+            validate_file_operation(path, "write")
+
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            size = 0
+            with open(full_path, "w", buffering=1 << 20, encoding="utf-8") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+
+            self._invalidate_files_cache()
+
+            return {
+                "status": "success",
+                "action": "write_file",
+                "path": self._rel(full_path),
+                "size": size
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "action": "write_file",
+                "path": path,
+                "error": str(e)
+            }
+
     def read_file(self, path: str) -> Dict[str, str]:
         """
         Read file content.
@@ -72,15 +240,26 @@ class FileSystemTool:
             full_path = validate_path(path, self.workspace_root)
             validate_file_operation(path, "read")
             
-            if not full_path.exists():
+            # The size probe doubles as the existence check (EAFP)
+            try:
+                size = full_path.stat().st_size
+            except FileNotFoundError:
                 raise FileNotFoundError(f"File not found: {path}")
-            
-            content = full_path.read_text(encoding="utf-8")
-            
+
+            if size >= MMAP_READ_THRESHOLD:
+                # Large files: map the pages read-only and decode straight
+                # from the mapping rather than copying into a bytes object
+                # first
+                with full_path.open("rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:].decode("utf-8")
+            else:
+                content = full_path.read_text(encoding="utf-8")
+
             return {
                 "status": "success",
                 "action": "read_file",
-                "path": str(full_path.relative_to(self.workspace_root)),
+                "path": self._rel(full_path),
                 "content": content
             }
         except Exception as e:
@@ -104,11 +283,13 @@ class FileSystemTool:
         try:
             full_path = validate_path(path, self.workspace_root)
             full_path.mkdir(parents=True, exist_ok=True)
-            
+
+            self._invalidate_files_cache()
+
             return {
                 "status": "success",
                 "action": "create_directory",
-                "path": str(full_path.relative_to(self.workspace_root))
+                "path": self._rel(full_path)
             }
         except Exception as e:
             return {
@@ -137,18 +318,23 @@ class FileSystemTool:
             if not full_path.is_dir():
                 raise NotADirectoryError(f"Not a directory: {path}")
             
+            # os.scandir reuses the dirent type info from one readdir pass
+            # instead of issuing fresh stat syscalls per entry
             items = []
-            for item in full_path.iterdir():
-                items.append({
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None
-                })
-            
+            with os.scandir(full_path) as entries:
+                for entry in entries:
+                    is_file = entry.is_file(follow_symlinks=False)
+                    items.append({
+                        "name": entry.name,
+                        "type": "directory" if entry.is_dir(follow_symlinks=False) else "file",
+                        "size": entry.stat(follow_symlinks=False).st_size if is_file else None
+                    })
+
+
             return {
                 "status": "success",
                 "action": "list_directory",
-                "path": str(full_path.relative_to(self.workspace_root)),
+                "path": self._rel(full_path),
                 "items": items
             }
         except Exception as e:
@@ -173,18 +359,21 @@ class FileSystemTool:
             full_path = validate_path(path, self.workspace_root)
             validate_file_operation(path, "delete")
             
-            if not full_path.exists():
-                raise FileNotFoundError(f"File not found: {path}")
-            
-            if full_path.is_file():
+            # EAFP: attempt the unlink directly - one syscall in the
+            # common case instead of exists/is_file stats first
+            try:
                 full_path.unlink()
-            elif full_path.is_dir():
+            except IsADirectoryError:
                 shutil.rmtree(full_path)
-            
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {path}")
+
+            self._invalidate_files_cache()
+
             return {
                 "status": "success",
                 "action": "delete_file",
-                "path": str(full_path.relative_to(self.workspace_root))
+                "path": self._rel(full_path)
             }
         except Exception as e:
             return {
@@ -3,9 +3,13 @@ Safety enforcement for Newla AI
 Ensures all operations are sandboxed within workspace/.
 """
 from pathlib import Path
-from typing import List
+from typing import Dict, FrozenSet, List, Match, Optional, Pattern
+import os
+import re
 
-FORBIDDEN_PATTERNS = [
+# Module is fully annotated so it can be compiled with mypyc as a drop-in
+# C extension; the Python source stays the importable fallback.
+FORBIDDEN_PATTERNS: List[str] = [
      "..",
     "~",
     "rm -rf",
@@ -18,7 +22,7 @@ FORBIDDEN_PATTERNS = [
     "dd if=",
     ":(){ :|:& };:",  # Fork bomb
 ]
-ALLOWED_COMMANDS=[
+ALLOWED_COMMANDS: List[str] = [
     "python",
     "node",
     "npm",
@@ -37,6 +41,30 @@ ALLOWED_COMMANDS=[
     "serve",
     "http-server",
 ]
+# Compiled once at import: a single C-level scan over the command instead
+# of one Python substring loop per forbidden pattern, and O(1) set lookup
+# for the common case of an exactly-allowed first word. IGNORECASE makes
+# the matcher safe for callers that don't pre-lowercase.
+_FORBIDDEN_RE: Pattern[str] = re.compile(
+    "|".join(re.escape(p) for p in FORBIDDEN_PATTERNS), re.IGNORECASE
+)
+_ALLOWED: FrozenSet[str] = frozenset(ALLOWED_COMMANDS)
+# Files that must never be deleted, matched as whole basenames in one
+# precompiled pass.
+_CRITICAL_RE: Pattern[str] = re.compile(r"(?:^|/)(__init__\.py|config\.py|main\.py)$")
+# Workspace roots resolve() to the same realpath for the life of the
+# process; caching the resolution avoids re-statting every component of
+# the root on each filesystem operation.
+_RESOLVED_ROOTS: Dict[str, str] = {}
+
+def _resolved_root(workspace_root:Path)->str:
+    """Return the cached resolved form of a workspace root."""
+    key: str = str(workspace_root)
+    resolved: Optional[str] = _RESOLVED_ROOTS.get(key)
+    if resolved is None:
+        resolved = str(workspace_root.resolve())
+        _RESOLVED_ROOTS[key] = resolved
+    return resolved
 def validate_command(cmd:str)->bool:
     """
     Validate that a command is safe to execute
@@ -47,14 +75,20 @@ def validate_command(cmd:str)->bool:
     Raises:
        RuntimeError: If command contains forbidden patterns
     """
-    cmd_lower = cmd.lower().strip()
+    cmd_lower: str = cmd.lower().strip()
+
+    match: Optional[Match[str]] = _FORBIDDEN_RE.search(cmd_lower)
+    if match:
+        raise RuntimeError(f"Unsafe command detected: '{match.group()}' found in '{cmd}' ")
 
-    for pattern in FORBIDDEN_PATTERNS:
-        if pattern in cmd_lower:
-            raise RuntimeError(f"Unsafe command detected: '{pattern}' found in '{cmd}' ")
-    
-    first_word = cmd.split()[0] if cmd.split() else ""
-    is_allowed = any(first_word.startswith(allowed) for allowed in ALLOWED_COMMANDS)
+    # split(None, 1) tokenizes only up to the first word, once
+    parts: List[str] = cmd.split(None, 1)
+    first_word: str = parts[0] if parts else ""
+    # Exact set membership covers the common case; the startswith scan is
+    # kept as a fallback so prefixed variants (e.g. python3) still pass.
+    is_allowed: bool = first_word in _ALLOWED or any(
+        first_word.startswith(allowed) for allowed in ALLOWED_COMMANDS
+    )
 
     if not is_allowed:
         raise RuntimeError(f"command '{first_word}' is not in the allowed list")
@@ -71,21 +105,22 @@ def validate_path(path:str,workspace_root:Path)->Path:
     Raises:
        RuntimeError: If path escapes workspace
     """
-    target_path = Path(path)
+    target_path: Path = Path(path)
     if target_path.is_absolute():
         raise RuntimeError(f"Absolute path not allowed : {path}")
-    
-    path_str = str(target_path)
+
+    path_str: str = str(target_path)
     if ".." in path_str:
         raise RuntimeError(f"Path traversal (..) not allowed: {path}")
     if "~" in path_str:
         raise RuntimeError(f"Home directory (~) not allowed: {path}")
-    
-    full_path = (workspace_root/target_path).resolve()
 
-    try:
-        full_path.relative_to(workspace_root.resolve())
-    except ValueError:
+    root_str: str = _resolved_root(workspace_root)
+    full_path: Path = Path(os.path.join(root_str, path_str)).resolve()
+
+    # Containment check on the already-resolved strings; commonpath is a
+    # pure string comparison, no extra stat calls
+    if os.path.commonpath([str(full_path), root_str]) != root_str:
         raise RuntimeError(f"Path escapes workspace:{path}")
     return full_path
 
@@ -101,8 +136,6 @@ def validate_file_operation(path:str,operation:str)->bool:
        RuntineError: If operation is unsafe
     """
 
-    if operation == "delete":
-        critical_files = ["__init__py","config.py","main.py"]
-        if any(critical_files in path for critical in critical_files):
-            raise RuntimeError(f"Can not delete critical file: {path}")
+    if operation == "delete" and _CRITICAL_RE.search(path):
+        raise RuntimeError(f"Can not delete critical file: {path}")
     return True
\ No newline at end of file
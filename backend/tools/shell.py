@@ -3,7 +3,12 @@ Shell command execution tool for Newla AI.
 Executes commands safely within workspace directory.
 """
 
+import select
 import subprocess
+import tempfile
+import threading
+import time
+import uuid
 from pathlib import Path
 from typing import Dict, Optional
 from .safety import validate_command
@@ -12,53 +17,174 @@ import os
 
 class ShellTool:
     """Handles safe shell command execution."""
-    
+
     def __init__(self, workspace_root: Path, timeout: int = 30):
         """
         Initialize shell tool.
-        
+
         Args:
             workspace_root: Root directory for command execution
             timeout: Command timeout in seconds
         """
         self.workspace_root = workspace_root.resolve()
         self.timeout = timeout
-    
+        # Long-lived bash worker: commands are written to its stdin and
+        # results read back up to a sentinel, so each call skips the
+        # ~50ms fork+exec+shell-init of a fresh subprocess. There is one
+        # worker with one stdin/stdout pair, so concurrent callers (e.g.
+        # /run-batch gathering threads on one orchestrator) are
+        # serialized behind the lock - overlapping writes would interleave
+        # commands and race on reads.
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def _ensure_worker(self) -> Optional[subprocess.Popen]:
+        """Get the persistent bash worker, spawning it if needed."""
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+        try:
+            # Unbuffered byte pipes: output is drained with select+os.read
+            # so no data can get stranded in a userspace buffer between
+            # polls
+            self._worker = subprocess.Popen(
+                ["bash"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.workspace_root),
+                bufsize=0,
+                env=os.environ.copy()
+            )
+        except OSError:
+            self._worker = None
+        return self._worker
+
+    def _kill_worker(self):
+        """Kill the worker so the next call respawns a clean one."""
+        if self._worker is not None:
+            self._worker.kill()
+            self._worker = None
+
+    def _execute_in_worker(self, command: str, worker: subprocess.Popen) -> Dict[str, any]:
+        """
+        Run a command in the persistent worker.
+
+        The command runs in a subshell so cd/env changes don't leak
+        between calls, with stderr captured to a per-call scratch file
+        outside the workspace (so a timeout can't strand it in file
+        listings). Output is read until a per-call sentinel line
+        carrying the exit code. Callers must hold _worker_lock.
+        """
+        sentinel = f"__newla_done_{uuid.uuid4().hex}__"
+        stderr_path = Path(tempfile.gettempdir()) / f"{sentinel}.stderr"
+        worker.stdin.write(
+            f"( {command}\n) 2> {stderr_path}\n"
+            f"printf '\\n%s %s\\n' {sentinel} $?\n".encode()
+        )
+        worker.stdin.flush()
+
+        deadline = time.monotonic() + self.timeout
+        fd = worker.stdout.fileno()
+        marker = f"\n{sentinel} ".encode()
+        buf = bytearray()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._kill_worker()
+                try:
+                    stderr_path.unlink()
+                except OSError:
+                    pass
+                return {
+                    "status": "error",
+                    "action": "execute_command",
+                    "command": command,
+                    "error": f"Command timed out after {self.timeout} seconds"
+                }
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                # Worker died mid-command
+                self._kill_worker()
+                try:
+                    stderr_path.unlink()
+                except OSError:
+                    pass
+                raise OSError("shell worker exited unexpectedly")
+            buf += chunk
+            idx = buf.find(marker)
+            if idx != -1:
+                end = buf.find(b"\n", idx + len(marker))
+                if end != -1:
+                    returncode = int(buf[idx + len(marker):end])
+                    break
+
+        stdout = buf[:idx].decode("utf-8", errors="replace")
+        try:
+            stderr = stderr_path.read_text()
+            stderr_path.unlink()
+        except OSError:
+            stderr = ""
+
+        return {
+            "status": "success" if returncode == 0 else "error",
+            "action": "execute_command",
+            "command": command,
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr
+        }
+
+    def _execute_subprocess(self, command: str, capture_output: bool) -> Dict[str, any]:
+        """Run a command in a fresh subprocess (fallback path)."""
+        result = subprocess.run(
+            command,
+            shell=True,
+            cwd=str(self.workspace_root),
+            capture_output=capture_output,
+            text=True,
+            timeout=self.timeout,
+            env=os.environ.copy()
+        )
+
+        return {
+            "status": "success" if result.returncode == 0 else "error",
+            "action": "execute_command",
+            "command": command,
+            "returncode": result.returncode,
+            "stdout": result.stdout if capture_output else None,
+            "stderr": result.stderr if capture_output else None
+        }
+
     def execute(self, command: str, capture_output: bool = True) -> Dict[str, any]:
         """
         Execute a shell command safely.
-        
+
         Args:
             command: Command to execute
             capture_output: Whether to capture stdout/stderr
-            
+
         Returns:
             Execution result dictionary
         """
         try:
             # Validate command safety
             validate_command(command)
-            
-            # Execute in workspace directory
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=str(self.workspace_root),
-                capture_output=capture_output,
-                text=True,
-                timeout=self.timeout,
-                env=os.environ.copy()
-            )
-            
-            return {
-                "status": "success" if result.returncode == 0 else "error",
-                "action": "execute_command",
-                "command": command,
-                "returncode": result.returncode,
-                "stdout": result.stdout if capture_output else None,
-                "stderr": result.stderr if capture_output else None
-            }
-            
+
+            if capture_output:
+                # One caller in the worker at a time: the lock covers
+                # spawn/kill and the full write-command/read-result cycle
+                with self._worker_lock:
+                    worker = self._ensure_worker()
+                    if worker is not None:
+                        try:
+                            return self._execute_in_worker(command, worker)
+                        except OSError:
+                            pass  # fall through to the one-shot path
+            return self._execute_subprocess(command, capture_output)
+
         except subprocess.TimeoutExpired:
             return {
                 "status": "error",
@@ -73,15 +199,15 @@ class ShellTool:
                 "command": command,
                 "error": str(e)
             }
-    
+
     def install_dependencies(self, package_manager: str, packages: list) -> Dict[str, any]:
         """
         Install dependencies using pip or npm.
-        
+
         Args:
             package_manager: "pip" or "npm"
             packages: List of package names
-            
+
         Returns:
             Installation result
         """
@@ -94,17 +220,17 @@ class ShellTool:
                 "status": "error",
                 "error": f"Unsupported package manager: {package_manager}"
             }
-        
+
         return self.execute(cmd)
-    
+
     def run_server(self, command: str, background: bool = False) -> Dict[str, any]:
         """
         Start a development server.
-        
+
         Args:
             command: Server start command
             background: Whether to run in background
-            
+
         Returns:
             Execution result
         """
@@ -113,22 +239,22 @@ class ShellTool:
             return self.execute(f"{command} &", capture_output=False)
         else:
             return self.execute(command)
-    
+
     def git_init(self, repo_name: Optional[str] = None) -> Dict[str, any]:
         """
         Initialize a git repository.
-        
+
         Args:
             repo_name: Optional repository name
-            
+
         Returns:
             Git init result
         """
         result = self.execute("git init")
-        
+
         if result["status"] == "success" and repo_name:
             # Add initial commit
             self.execute("git add .")
             self.execute(f'git commit -m "Initial commit for {repo_name}"')
-        
-        return result
\ No newline at end of file
+
+        return result
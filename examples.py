@@ -3,20 +3,63 @@ Example usage scripts for Newla AI
 Demonstrates common use cases
 """
 
+import aiohttp
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
+import socket
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:  # optional - the aiohttp/requests paths still work
+    httpx = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # optional speedup - stdlib json still works
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Block-buffer stdout: prints accumulate in one userspace buffer instead
+# of paying a write syscall per line when redirected to a file/CI log
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
 
 # Server URL
 BASE_URL = "http://localhost:8000"
 
+# One shared session: urllib3 keep-alive pooling means the examples reuse
+# a warm TCP connection instead of paying connect + handshake per call.
+# Pool sizing matches the workload (one host, at most a handful of
+# concurrent calls), and Retry absorbs transient connect failures and
+# gateway errors with a short backoff instead of aborting the run.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+    ),
+))
 
-def example_1_simple_website():
-    """Example 1: Create a simple HTML website."""
-    
-    print("Example 1: Simple Website")
-    print("-" * 60)
-    
-    prompt = """
+
+# Example prompts hoisted to module constants: stored once in
+# co_consts at compile time instead of being rebuilt per call, and
+# addressable by number for memoized reruns
+_PROMPT_1 = """
     Create a single-page gym website.
     File: gym.html
     Gym Name: Iron Temple Gym
@@ -24,25 +67,8 @@ def example_1_simple_website():
     Use modern UI and responsive CSS.
     Include inline CSS and make it visually appealing.
     """
-    
-    response = requests.post(
-        f"{BASE_URL}/run",
-        json={"prompt": prompt}
-    )
-    
-    result = response.json()
-    print(f"Status: {result['status']}")
-    print(f"Files created: {result.get('files_created', [])}")
-    print("\n")
 
-
-def example_2_python_script():
-    """Example 2: Create a Python script."""
-    
-    print("Example 2: Python Script")
-    print("-" * 60)
-    
-    prompt = """
+_PROMPT_2 = """
     Create a Python script that:
     1. Generates 10 random passwords
     2. Each password is 12 characters long
@@ -53,25 +79,8 @@ def example_2_python_script():
     File: password_generator.py
     Include comments and good code structure.
     """
-    
-    response = requests.post(
-        f"{BASE_URL}/run",
-        json={"prompt": prompt}
-    )
-    
-    result = response.json()
-    print(f"Status: {result['status']}")
-    print(f"Files created: {result.get('files_created', [])}")
-    print("\n")
 
-
-def example_3_web_app():
-    """Example 3: Create a web application."""
-    
-    print("Example 3: Flask Web App")
-    print("-" * 60)
-    
-    prompt = """
+_PROMPT_3 = """
     Create a Flask web application with:
     
     Files:
@@ -89,25 +98,8 @@ def example_3_web_app():
     
     Make it production-ready with proper structure.
     """
-    
-    response = requests.post(
-        f"{BASE_URL}/run",
-        json={"prompt": prompt}
-    )
-    
-    result = response.json()
-    print(f"Status: {result['status']}")
-    print(f"Files created: {result.get('files_created', [])}")
-    print("\n")
-
 
-def example_4_data_analysis():
-    """Example 4: Create a data analysis script."""
-    
-    print("Example 4: Data Analysis")
-    print("-" * 60)
-    
-    prompt = """
+_PROMPT_4 = """
     Create a Python data analysis script:
     
     File: analyze_sales.py
@@ -123,25 +115,8 @@ def example_4_data_analysis():
     Use pandas for data manipulation.
     Include all necessary imports.
     """
-    
-    response = requests.post(
-        f"{BASE_URL}/run",
-        json={"prompt": prompt}
-    )
-    
-    result = response.json()
-    print(f"Status: {result['status']}")
-    print(f"Files created: {result.get('files_created', [])}")
-    print("\n")
-
 
-def example_5_react_component():
-    """Example 5: Create a React component."""
-    
-    print("Example 5: React Component")
-    print("-" * 60)
-    
-    prompt = """
+_PROMPT_5 = """
     Create a React countdown timer component:
     
     File: CountdownTimer.jsx
@@ -158,39 +133,282 @@ def example_5_react_component():
     
     Make it a complete, working component.
     """
+
+_PROMPTS = {
+    1: _PROMPT_1,
+    2: _PROMPT_2,
+    3: _PROMPT_3,
+    4: _PROMPT_4,
+    5: _PROMPT_5,
+}
+
+
+async def example_1_simple_website(session):
+    """Example 1: Create a simple HTML website."""
+    
+    print("Example 1: Simple Website")
+    print("-" * 60)
     
-    response = requests.post(
+    prompt = _PROMPT_1
+    
+    async with session.post(
         f"{BASE_URL}/run",
         json={"prompt": prompt}
-    )
+    ) as response:
+        result = await response.json()
+    print(f"Status: {result['status']}")
+    print(f"Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+async def example_2_python_script(session):
+    """Example 2: Create a Python script."""
+    
+    print("Example 2: Python Script")
+    print("-" * 60)
     
-    result = response.json()
+    prompt = _PROMPT_2
+    
+    async with session.post(
+        f"{BASE_URL}/run",
+        json={"prompt": prompt}
+    ) as response:
+        result = await response.json()
     print(f"Status: {result['status']}")
     print(f"Files created: {result.get('files_created', [])}")
     print("\n")
 
 
+async def example_3_web_app(session):
+    """Example 3: Create a web application."""
+    
+    print("Example 3: Flask Web App")
+    print("-" * 60)
+    
+    prompt = _PROMPT_3
+    
+    async with session.post(
+        f"{BASE_URL}/run",
+        json={"prompt": prompt}
+    ) as response:
+        result = await response.json()
+    print(f"Status: {result['status']}")
+    print(f"Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+async def example_4_data_analysis(session):
+    """Example 4: Create a data analysis script."""
+    
+    print("Example 4: Data Analysis")
+    print("-" * 60)
+    
+    prompt = _PROMPT_4
+    
+    async with session.post(
+        f"{BASE_URL}/run",
+        json={"prompt": prompt}
+    ) as response:
+        result = await response.json()
+    print(f"Status: {result['status']}")
+    print(f"Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+async def example_5_react_component(session):
+    """Example 5: Create a React component."""
+    
+    print("Example 5: React Component")
+    print("-" * 60)
+    
+    prompt = _PROMPT_5
+    
+    async with session.post(
+        f"{BASE_URL}/run",
+        json={"prompt": prompt}
+    ) as response:
+        result = await response.json()
+    print(f"Status: {result['status']}")
+    print(f"Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+def _post(path, obj, **kwargs):
+    """POST a JSON payload and parse the response with orjson.
+
+    Serializes with orjson instead of the stdlib encoder requests uses
+    for json=, and parses response.content directly - both C-level
+    passes, which matters for large /run results and file listings.
+
+    Args:
+        path: Server path (e.g. "/run")
+        obj: JSON-serializable payload
+        **kwargs: Extra arguments for Session.post
+
+    Returns:
+        Parsed response body
+    """
+    response = SESSION.post(
+        BASE_URL + path, data=_dumps(obj), headers=_JSON_HEADERS, **kwargs
+    )
+    return _loads(response.content)
+
+
+@functools.lru_cache(maxsize=8)
+def run_example(n):
+    """Run one numbered example synchronously, memoized per number.
+
+    Repeated dev-loop invocations of the same example return the cached
+    result instead of re-paying the full LLM round trip.
+
+    Args:
+        n: Example number (1-5)
+
+    Returns:
+        Parsed /run response
+    """
+    return _post("/run", {"prompt": _PROMPTS[n]})
+
+
+def run_examples_batch():
+    """Run all five example prompts through a single /run-batch POST.
+
+    One request carries every prompt, so HTTP framing and server-side
+    setup are paid once for the whole batch instead of per example.
+    """
+    batch = _post("/run-batch", {"prompts": list(_PROMPTS.values())}, timeout=600)
+    for n, result in zip(_PROMPTS, batch.get("results", [])):
+        print(f"Example {n}: {result.get('status')}")
+        print(f"  Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+async def run_all_examples():
+    """Run all five examples concurrently over one aiohttp session.
+
+    The examples are independent POSTs dominated by server-side LLM
+    latency, so overlapping them costs max(latencies) wall-clock instead
+    of their sum.
+    """
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            example_1_simple_website(session),
+            example_2_python_script(session),
+            example_3_web_app(session),
+            example_4_data_analysis(session),
+            example_5_react_component(session),
+            return_exceptions=True
+        )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Example failed: {result}")
+
+
+async def run_all_examples_http2():
+    """Run all five example prompts multiplexed over one HTTP/2 connection.
+
+    With HTTP/2 the concurrent POSTs share a single TCP connection as
+    multiplexed streams, so the batch costs one handshake plus
+    max(latencies) - no per-request socket and no pool to exhaust.
+    Requires httpx (and the h2 extra, plus a server started with HTTP/2
+    enabled); falls back to HTTP/1.1 keep-alive when h2 is missing.
+    """
+    if httpx is None:
+        print("httpx is not installed - falling back to aiohttp")
+        await run_all_examples()
+        return
+    try:
+        client = httpx.AsyncClient(http2=True, base_url=BASE_URL, timeout=600)
+    except ImportError:  # h2 extra not installed
+        client = httpx.AsyncClient(base_url=BASE_URL, timeout=600)
+    async with client:
+        responses = await asyncio.gather(
+            *(client.post("/run", json={"prompt": p}) for p in _PROMPTS.values()),
+            return_exceptions=True
+        )
+    for n, response in zip(_PROMPTS, responses):
+        if isinstance(response, Exception):
+            print(f"Example {n} failed: {response}")
+            continue
+        result = _loads(response.content)
+        print(f"Example {n}: {result.get('status')}")
+        print(f"  Files created: {result.get('files_created', [])}")
+    print("\n")
+
+
+# Conditional-GET memo for /workspace: the server issues an ETag over the
+# summary, so the second check after an unchanged run costs a 304 with no
+# body instead of a full listing + parse
+_WS_CACHE = {"etag": None, "body": None}
+
+
+def stream_workspace_files():
+    """Yield workspace file paths from the NDJSON streaming endpoint.
+
+    Records are parsed line by line as they arrive, so memory stays flat
+    and the first file prints at time-to-first-byte instead of after the
+    whole listing is downloaded and parsed.
+    """
+    with SESSION.get(f"{BASE_URL}/workspace/files_stream", stream=True) as r:
+        lines = r.iter_lines()
+        next(lines, None)  # preamble line with the total
+        for line in lines:
+            if line:
+                yield _loads(line)["path"]
+
+
 def check_workspace():
     """Check current workspace status."""
-    
+
     print("Current Workspace Status")
     print("=" * 60)
-    
-    response = requests.get(f"{BASE_URL}/workspace")
-    workspace = response.json()
-    
+
+    headers = {"If-None-Match": _WS_CACHE["etag"]} if _WS_CACHE["etag"] else {}
+    response = SESSION.get(f"{BASE_URL}/workspace", headers=headers)
+    if response.status_code == 304:
+        workspace = _WS_CACHE["body"]
+    else:
+        workspace = _loads(response.content)
+        _WS_CACHE["etag"] = response.headers.get("ETag")
+        _WS_CACHE["body"] = workspace
+
     print(f"Workspace: {workspace['workspace_root']}")
     print(f"Total files: {workspace['total_files']}")
     print(f"Total executions: {workspace['total_executions']}")
     
-    if workspace['files']:
+    if workspace['total_files']:
         print("\nFiles:")
-        for file in workspace['files']:
+        for file in stream_workspace_files():
             print(f"  - {file}")
     
     print("\n")
 
 
+def wait_for_server(host="localhost", port=8000, attempts=5):
+    """Probe the server port with bounded exponential backoff.
+
+    A raw TCP connect with a 0.5s timeout fails fast when the server is
+    down, instead of hanging on an HTTP connect for the OS default. Worst
+    case is bounded at roughly two seconds across all attempts.
+
+    Args:
+        host: Server host
+        port: Server port
+        attempts: Maximum connection attempts
+
+    Returns:
+        True once the port accepts a connection, False otherwise
+    """
+    for i in range(attempts):
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return True
+        except OSError:
+            if i < attempts - 1:
+                time.sleep(0.1 * 2 ** i)
+    return False
+
+
 def main():
     """Run example demonstrations."""
     
@@ -202,8 +420,13 @@ def main():
     print("\n")
     
     try:
-        # Check if server is running
-        response = requests.get(f"{BASE_URL}/health")
+        # Cheap TCP probe first - bounded wait when the server is down
+        if not wait_for_server():
+            print("Server is not responding!")
+            return
+
+        # Then validate the protocol with the real health check
+        response = SESSION.get(f"{BASE_URL}/health")
         if response.status_code != 200:
             print("Server is not responding!")
             return
@@ -216,26 +439,25 @@ def main():
         # Run examples
         print("Running examples...\n")
         
-        # Uncomment the examples you want to run:
-        
-        # example_1_simple_website()
-        # example_2_python_script()
-        # example_3_web_app()
-        # example_4_data_analysis()
-        # example_5_react_component()
+        # Uncomment to run all five examples concurrently,
+        # multiplexed over HTTP/2, or as one batched request:
+
+        # asyncio.run(run_all_examples())
+        # asyncio.run(run_all_examples_http2())
+        # run_examples_batch()
         
-        print("\nTo run examples, uncomment them in the main() function")
-        print("of examples.py and run again.")
+        print("\nTo run examples, uncomment asyncio.run(run_all_examples())")
+        print("in the main() function of examples.py and run again.")
         
         # Final workspace check
         print("\n")
         check_workspace()
         
-    except requests.exceptions.ConnectionError:
-        print("Could not connect to server!")
-        print("Make sure Newla AI is running: cd backend && python main.py")
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        SESSION.close()
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,106 +1,177 @@
 """
 Test script for Newla AI
 Run this to verify basic functionality
+
+Set NEWLA_RUN_LLM_TEST=1 to also run the LLM-based project test
+(requires API keys to be configured).
 """
 
+import functools
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Block-buffer stdout: prints accumulate in one userspace buffer instead
+# of paying a write syscall per line when redirected to a file/CI log
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
-# from .backend.agent import NewlaOrchestrator
-from backend.agent import NewlaOrchestrator
-# from .backend.config import WORKSPACE_ROOT
-from backend.config import WORKSPACE_ROOT
+# The orchestrator (and with it the whole LLM + tool chain) is imported
+# lazily inside the test functions, so failure/skip paths don't pay the
+# full backend import cost up front
+
+
+@functools.lru_cache(maxsize=1)
+def get_orchestrator():
+    """Build the orchestrator once and share it across tests.
+
+    Initialization scans the workspace and constructs the LLM clients;
+    memoizing it means the second test starts instantly instead of
+    paying that setup again.
+    """
+    from backend.agent import NewlaOrchestrator
+    return NewlaOrchestrator()
+
+
+def _flush_buffer(buf):
+    """Write a phase's buffered output to stdout in one call."""
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+
+def _phase_fs(orchestrator):
+    """Phases 3-4: file and directory operations (batched)."""
+
+    # Per-phase buffer: one stdout write per phase, which also keeps the
+    # output of parallel phases from interleaving
+    buf = io.StringIO()
+    try:
+        buf.write("\n3/4. Testing file and directory operations...\n")
+        result, read_result, dir_result = orchestrator.executor.fs_tool.bulk_ops([
+            ("write", "test.txt", "Hello from Newla AI"),
+            ("read", "test.txt", None),
+            ("mkdir", "test_dir", None),
+        ])
+        if result["status"] == "success":
+            buf.write(" File write successful\n")
+        else:
+            buf.write(f" File write failed: {result.get('error')}\n")
+            return False
+
+        if read_result["status"] == "success":
+            buf.write(" File read successful\n")
+            buf.write(f"   Content: {read_result['content'][:50]}...\n")
+        else:
+            buf.write(f" File read failed: {read_result.get('error')}\n")
+            return False
+
+        if dir_result["status"] == "success":
+            buf.write(" Directory creation successful\n")
+        else:
+            buf.write(f" Directory creation failed: {dir_result.get('error')}\n")
+            return False
+        return True
+    finally:
+        _flush_buffer(buf)
+
+
+def _phase_safety(orchestrator):
+    """Phase 5: safety validation."""
+
+    buf = io.StringIO()
+    try:
+        buf.write("\n5. Testing safety validation...\n")
+        from backend.config import WORKSPACE_ROOT
+        from backend.tools.safety import validate_command, validate_path
+
+        try:
+            validate_command("python script.py")
+            buf.write(" Safe command validated\n")
+        except RuntimeError as e:
+            buf.write(f" Safe command rejected: {e}\n")
+            return False
+
+        try:
+            validate_command("rm -rf /")
+            buf.write(" Unsafe command not caught!\n")
+            return False
+        except RuntimeError:
+            buf.write(" Unsafe command blocked\n")
+
+        try:
+            validate_path("../etc/passwd", WORKSPACE_ROOT)
+            buf.write(" Path traversal not caught!\n")
+            return False
+        except RuntimeError:
+            buf.write(" Path traversal blocked\n")
+
+        # Micro-loop: the forbidden-pattern matcher is compiled once at
+        # import, so repeated validations should stay in the microsecond range
+        import time
+        start = time.perf_counter()
+        for _ in range(10000):
+            validate_command("python script.py")
+        elapsed = time.perf_counter() - start
+        buf.write(f" 10k command validations in {elapsed:.3f}s\n")
+        return True
+    finally:
+        _flush_buffer(buf)
+
+
+def _phase_shell(orchestrator):
+    """Phase 6: shell command execution."""
+
+    buf = io.StringIO()
+    try:
+        buf.write("\n6. Testing shell commands...\n")
+        shell_result = orchestrator.executor.shell_tool.execute("echo 'Hello Shell'")
+        if shell_result["status"] == "success":
+            buf.write(" Shell command execution successful\n")
+            buf.write(f" Output: {shell_result['stdout'].strip()}\n")
+        else:
+            buf.write(f" Shell command failed: {shell_result.get('error')}\n")
+        return True
+    finally:
+        _flush_buffer(buf)
 
 
 def test_basic_functionality():
     """Test basic agent functionality."""
-    
+
     print("=" * 60)
     print("Testing Newla AI - Basic Functionality")
     print("=" * 60)
-    
-    # Initialize orchestrator
+
+    # Initialize orchestrator (serial - the later phases depend on it)
     print("\n1. Initializing orchestrator...")
-    orchestrator = NewlaOrchestrator()
+    orchestrator = get_orchestrator()
     print(" Orchestrator initialized")
-    
+
     # Test workspace creation
     print("\n2. Testing workspace...")
     summary = orchestrator.get_project_summary()
     print(f" Workspace: {summary['workspace_root']}")
     print(f" Total files: {summary['total_files']}")
-    
-    # Test file operations
-    print("\n3. Testing file operations...")
-    result = orchestrator.executor.fs_tool.write_file(
-        "test.txt",
-        "Hello from Newla AI"
-    )
-    if result["status"] == "success":
-        print(" File write successful")
-    else:
-        print(f" File write failed: {result.get('error')}")
-        return False
-    
-    # Test file read
-    read_result = orchestrator.executor.fs_tool.read_file("test.txt")
-    if read_result["status"] == "success":
-        print(" File read successful")
-        print(f"   Content: {read_result['content'][:50]}...")
-    else:
-        print(f" File read failed: {read_result.get('error')}")
-        return False
-    
-    # Test directory operations
-    print("\n4. Testing directory operations...")
-    dir_result = orchestrator.executor.fs_tool.create_directory("test_dir")
-    if dir_result["status"] == "success":
-        print(" Directory creation successful")
-    else:
-        print(f" Directory creation failed: {dir_result.get('error')}")
-        return False
-    
-    # Test safety validation
-    print("\n5. Testing safety validation...")
-    from backend.tools.safety import validate_command, validate_path
-    
-    try:
-        validate_command("python script.py")
-        print(" Safe command validated")
-    except RuntimeError as e:
-        print(f" Safe command rejected: {e}")
-        return False
-    
-    try:
-        validate_command("rm -rf /")
-        print(" Unsafe command not caught!")
-        return False
-    except RuntimeError:
-        print(" Unsafe command blocked")
-    
-    try:
-        validate_path("../etc/passwd", WORKSPACE_ROOT)
-        print(" Path traversal not caught!")
+
+    # Phases 3-6 are independent of each other and mostly wait on disk
+    # or subprocess I/O (which releases the GIL), so they run in parallel
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(
+            lambda phase: phase(orchestrator),
+            [_phase_fs, _phase_safety, _phase_shell]
+        ))
+    if not all(results):
         return False
-    except RuntimeError:
-        print(" Path traversal blocked")
-    
-    # Test shell commands
-    print("\n6. Testing shell commands...")
-    shell_result = orchestrator.executor.shell_tool.execute("echo 'Hello Shell'")
-    if shell_result["status"] == "success":
-        print(" Shell command execution successful")
-        print(f" Output: {shell_result['stdout'].strip()}")
-    else:
-        print(f" Shell command failed: {shell_result.get('error')}")
-    
+
     print("\n" + "=" * 60)
     print(" All basic tests passed!")
     print("=" * 60)
-    
+
     return True
 
 
@@ -111,8 +182,8 @@ def test_simple_project():
     print(" Testing Simple Project Creation")
     print("=" * 60)
     
-    orchestrator = NewlaOrchestrator()
-    
+    orchestrator = get_orchestrator()
+
     # Create a simple HTML file
     simple_request = """
     Create a simple HTML file named hello.html with:
@@ -148,12 +219,13 @@ if __name__ == "__main__":
     
     # Run basic tests
     if test_basic_functionality():
-        # Optionally run project test
-        user_input = input("\n\nRun LLM-based project test? (requires API keys) [y/N]: ")
-        if user_input.lower() == 'y':
+        # Optionally run the project test - env-var gated so the script
+        # runs to completion unattended (CI, batch invocations)
+        if os.environ.get("NEWLA_RUN_LLM_TEST") == "1":
             test_simple_project()
     else:
         print("\nBasic tests failed!")
         sys.exit(1)
     
-    print("\nTesting complete!\n")
\ No newline at end of file
+    print("\nTesting complete!\n")
+    sys.stdout.flush()
\ No newline at end of file